@@ -0,0 +1,29 @@
+"""
+Hashable fingerprints of retrieved chunks for the composer's output caches
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+# Marks a chunk without a 'source' key inside cache keys
+_NO_SOURCE = object()
+
+def chunk_cache_key(top_chunks: Sequence[Dict]) -> Tuple:
+    """
+    Ordered (source, text) pairs of the given chunks
+
+    Raises:
+        TypeError: If a source or text is unhashable, so the caller can skip its cache
+    """
+    key = tuple(
+        (chunk.get('source', _NO_SOURCE), chunk.get('text', ''))
+        for chunk in top_chunks
+    )
+    hash(key)
+    return key
+
+def chunks_from_key(key: Tuple) -> List[Dict]:
+    """Rebuild chunk dicts (source and text only) from a chunk_cache_key result"""
+    return [
+        {'text': text} if source is _NO_SOURCE else {'source': source, 'text': text}
+        for source, text in key
+    ]
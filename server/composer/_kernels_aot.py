@@ -0,0 +1,23 @@
+"""
+Ahead-of-time build of the Uniguru-LM n-gram scoring kernel
+
+Compiles the Numba kernel from ngram_scorer_numba into the extension module
+composer._ngram_kernels_aot, so importing the scorer loads machine code
+instead of JIT-compiling. Build it with `python -m composer._kernels_aot`,
+or through setup.py when Numba is installed in the build environment.
+"""
+
+from numba.pycc import CC
+
+from composer.ngram_scorer_numba import _score_sentences
+
+cc = CC('_ngram_kernels_aot')
+cc.verbose = False
+
+cc.export(
+    'score_sentences',
+    'UniTuple(f8, 2)(i4[:], i8[:], f8[:, :, :], f8[:, :])'
+)(_score_sentences)
+
+if __name__ == '__main__':
+    cc.compile()
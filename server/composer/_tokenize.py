@@ -0,0 +1,33 @@
+"""
+Shared word tokenisers for the Uniguru-LM composer
+Compiles the token patterns once, with Google's RE2 (linear-time DFA) when installed
+"""
+
+import re
+
+# Optional RE2 engine (pip install google-re2)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+def _compile_dfa(pattern: str):
+    """
+    Compile a pattern made only of explicit character classes
+
+    Such patterns match identically under RE2 and Python's re, so they use
+    RE2 when available. Patterns relying on \\b or \\w must stay on re: RE2
+    treats both as ASCII-only, while Python's are Unicode-aware.
+    """
+    return re2.compile(pattern) if RE2_AVAILABLE else re.compile(pattern)
+
+# Devanagari block; non-raw strings, so Python expands the \u escapes and
+# both engines receive the same literal code points
+DEVANAGARI_RE = _compile_dfa('[\u0900-\u097F]')
+DEVANAGARI_TOKEN_RE = _compile_dfa('[\u0900-\u097F]+')
+HINDI_WORD_RE = _compile_dfa('[\u0900-\u097F]+|[A-Za-z]+')
+
+# Unicode-aware word boundaries
+WORD_RE = re.compile(r'\b\w+\b')
+LATIN_TOKEN_RE = re.compile(r'\b[a-zA-Z]+\b')
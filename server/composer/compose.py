@@ -6,7 +6,9 @@ Day 2: Enhanced with RL policy and strengthened grounding verification
 
 import logging
 import time
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
+from ._chunk_keys import chunk_cache_key, chunks_from_key
 from .templates import TemplateEngine
 from .ngram_scorer import NGramScorer
 from .gru import GRUStub
@@ -28,6 +30,8 @@ class Composer:
         self.grounding_verifier = GroundingVerifier()
         self.rl_policy = get_rl_policy()  # RL policy for template selection
         self.performance_monitor = get_performance_monitor()  # Performance monitoring
+        # Memoised deterministic part of compose(), keyed by RL action and inputs
+        self._pipeline_cache = lru_cache(maxsize=256)(self._run_cached_pipeline)
         
     def compose(self, trace_id: str, extractive_answer: str, top_chunks: List[Dict], lang: str = "EN") -> Dict[str, Any]:
         """
@@ -60,63 +64,19 @@ class Composer:
             
             rl_action, action_metadata = self.rl_policy.select_action(policy_context)
             
-            # Map RL action to template
-            if rl_action == PolicyAction.EXPLAIN:
-                template_id, template = self.template_engine.get_explain_template(lang)
-            elif rl_action == PolicyAction.COMPARE:
-                template_id, template = self.template_engine.get_compare_template(lang)
-            elif rl_action == PolicyAction.EXAMPLE:
-                template_id, template = self.template_engine.get_example_template(lang)
-            else:  # EXTRACTIVE
-                template_id, template = self.template_engine.get_extractive_fallback(lang)
-            
-            # Fallback to content-based selection if RL template not suitable
-            if not self._is_template_suitable(template_id, extractive_answer, top_chunks):
-                logger.info(f"RL template {template_id} not suitable, falling back to content-based selection")
-                template_id, template = self.template_engine.select_template(
-                    extractive_answer, top_chunks, lang
-                )
-            
-            # Generate initial composition using template
-            composed_text = self.template_engine.apply_template(
-                template, extractive_answer, top_chunks, lang
-            )
-            
-            # Apply n-gram smoothing for better fluency
-            smoothed_text = self.ngram_scorer.smooth_text(composed_text, lang)
-            
-            # Try GRU enhancement if available, fallback to n-gram result
-            final_text = self._try_gru_enhancement(smoothed_text, top_chunks, lang)
-            
-            # Enhanced grounding verification with auto-fallback
-            grounding_result = self.grounding_verifier.verify_grounding(
-                final_text, top_chunks
-            )
-            
-            grounding_attempts = 1
-            max_grounding_attempts = 3
-            
-            # If grounding fails, apply progressive fallback strategy
-            while not grounding_result['grounded'] and grounding_attempts < max_grounding_attempts:
-                logger.warning(f"Grounding failed (attempt {grounding_attempts}), applying fallback strategy")
-                
-                if grounding_attempts == 1:
-                    # First fallback: Try extractive template
-                    template_id, fallback_template = self.template_engine.get_extractive_fallback(lang)
-                    final_text = self.template_engine.apply_template(
-                        fallback_template, extractive_answer, top_chunks, lang
-                    )
-                elif grounding_attempts == 2:
-                    # Second fallback: Improve grounding directly
-                    final_text = self.grounding_verifier.improve_grounding(
-                        final_text, top_chunks
-                    )
-                
-                # Re-verify grounding
-                grounding_result = self.grounding_verifier.verify_grounding(
-                    final_text, top_chunks
-                )
-                grounding_attempts += 1
+            # Run the deterministic template/smoothing/grounding pipeline,
+            # memoised on its inputs; unhashable chunk fields skip the cache
+            gru_available = self.gru_model.is_available()
+            try:
+                cache_key = (rl_action, extractive_answer, chunk_cache_key(top_chunks), lang, gru_available)
+                hash(cache_key)
+            except TypeError:
+                cache_key = None
+            if cache_key is None:
+                pipeline_result = self._run_pipeline(rl_action, extractive_answer, top_chunks, lang)
+            else:
+                pipeline_result = self._pipeline_cache(*cache_key)
+            template_id, final_text, grounded, grounding_score, overlapping_tokens, grounding_attempts = pipeline_result
             
             # Prepare response with RL integration
             composition_time = time.time() - start_time
@@ -125,12 +85,12 @@ class Composer:
                 'trace_id': trace_id,
                 'final_text': final_text,
                 'template_id': template_id,
-                'grounded': grounding_result['grounded'],
-                'grounding_score': grounding_result['score'],
-                'overlapping_tokens': grounding_result['overlapping_tokens'],
+                'grounded': grounded,
+                'grounding_score': grounding_score,
+                'overlapping_tokens': list(overlapping_tokens),
                 'composition_time_ms': round(composition_time * 1000, 2),
                 'lang': lang,
-                'method': 'gru' if self.gru_model.is_available() else 'ngram_template',
+                'method': 'gru' if gru_available else 'ngram_template',
                 'citations': self._extract_citations(top_chunks),
                 'grounding_attempts': grounding_attempts,
                 # RL metadata
@@ -147,7 +107,7 @@ class Composer:
             # Log composition trace for monitoring
             log_composition_trace(result, extractive_answer, top_chunks)
             
-            logger.info(f"Composition completed for trace_id: {trace_id}, grounded: {grounding_result['grounded']}")
+            logger.info(f"Composition completed for trace_id: {trace_id}, grounded: {grounded}")
             return result
             
         except Exception as e:
@@ -166,6 +126,98 @@ class Composer:
                 'citations': self._extract_citations(top_chunks) if top_chunks else []
             }
     
+    def _run_cached_pipeline(self, rl_action: PolicyAction, extractive_answer: str, chunk_key: Tuple,
+                             lang: str, gru_available: bool) -> Tuple:
+        """Pipeline over a hashable chunk fingerprint (memoised by _pipeline_cache)"""
+        return self._run_pipeline(rl_action, extractive_answer, chunks_from_key(chunk_key), lang)
+    
+    def clear_cache(self):
+        """
+        Drop memoised pipeline results and the template engine's cached outputs
+        
+        Entries otherwise live as long as this Composer. Call this after
+        changing the templates, n-gram models or grounding settings in place;
+        GRU availability is part of the key and needs no clearing.
+        """
+        self._pipeline_cache.cache_clear()
+        self.template_engine.clear_cache()
+    
+    def _run_pipeline(self, rl_action: PolicyAction, extractive_answer: str,
+                      top_chunks: List[Dict], lang: str) -> Tuple:
+        """
+        Template application, smoothing, GRU enhancement and grounding with fallbacks
+        
+        Returns:
+            Tuple of (template_id, final_text, grounded, grounding_score,
+            overlapping_tokens, grounding_attempts), immutable so it can be cached
+        """
+        # Map RL action to template
+        if rl_action == PolicyAction.EXPLAIN:
+            template_id, template = self.template_engine.get_explain_template(lang)
+        elif rl_action == PolicyAction.COMPARE:
+            template_id, template = self.template_engine.get_compare_template(lang)
+        elif rl_action == PolicyAction.EXAMPLE:
+            template_id, template = self.template_engine.get_example_template(lang)
+        else:  # EXTRACTIVE
+            template_id, template = self.template_engine.get_extractive_fallback(lang)
+        
+        # Generate initial composition using template, falling back to
+        # content-based selection if RL template not suitable
+        if self._is_template_suitable(template_id, extractive_answer, top_chunks):
+            composed_text = self.template_engine.apply_template(
+                template, extractive_answer, top_chunks, lang
+            )
+        else:
+            logger.info(f"RL template {template_id} not suitable, falling back to content-based selection")
+            template_id, composed_text = self.template_engine.compose(
+                extractive_answer, top_chunks, lang
+            )
+        
+        # Apply n-gram smoothing for better fluency
+        smoothed_text = self.ngram_scorer.smooth_text(composed_text, lang)
+        
+        # Try GRU enhancement if available, fallback to n-gram result
+        final_text = self._try_gru_enhancement(smoothed_text, top_chunks, lang)
+        
+        # Enhanced grounding verification with auto-fallback
+        grounding_result = self.grounding_verifier.verify_grounding(
+            final_text, top_chunks
+        )
+        
+        grounding_attempts = 1
+        max_grounding_attempts = 3
+        
+        # If grounding fails, apply progressive fallback strategy
+        while not grounding_result['grounded'] and grounding_attempts < max_grounding_attempts:
+            logger.warning(f"Grounding failed (attempt {grounding_attempts}), applying fallback strategy")
+            
+            if grounding_attempts == 1:
+                # First fallback: Try extractive template
+                template_id, fallback_template = self.template_engine.get_extractive_fallback(lang)
+                final_text = self.template_engine.apply_template(
+                    fallback_template, extractive_answer, top_chunks, lang
+                )
+            elif grounding_attempts == 2:
+                # Second fallback: Improve grounding directly
+                final_text = self.grounding_verifier.improve_grounding(
+                    final_text, top_chunks
+                )
+            
+            # Re-verify grounding
+            grounding_result = self.grounding_verifier.verify_grounding(
+                final_text, top_chunks
+            )
+            grounding_attempts += 1
+        
+        return (
+            template_id,
+            final_text,
+            grounding_result['grounded'],
+            grounding_result['score'],
+            tuple(grounding_result['overlapping_tokens']),
+            grounding_attempts
+        )
+    
     def _try_gru_enhancement(self, text: str, top_chunks: List[Dict], lang: str) -> str:
         """Try to enhance text with GRU model, fallback to original if not available"""
         try:
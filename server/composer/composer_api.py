@@ -3,6 +3,7 @@ Composer API endpoint for Uniguru-LM
 Integrates with existing Express.js server via Python subprocess
 """
 
+import os
 import sys
 import json
 import logging
@@ -91,4 +92,7 @@ def main():
         sys.exit(1)
 
 if __name__ == '__main__':
+    # One process per request never recoups Numba's import and cache-load
+    # time; the AOT-compiled kernel, when built, is still used
+    os.environ.setdefault('COMPOSER_JIT', '0')
     main()
\ No newline at end of file
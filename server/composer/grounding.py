@@ -6,17 +6,56 @@ Ensures generated text has token overlap with source chunks
 import logging
 import re
 import string
-from typing import Dict, List, Set, Tuple, Any
+from typing import Dict, FrozenSet, List, Set, Tuple, Any
 from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from ._tokenize import DEVANAGARI_RE, DEVANAGARI_TOKEN_RE, LATIN_TOKEN_RE
 
 logger = logging.getLogger(__name__)
 
+# Punctuation stripping table, built once at import
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+# Stopwords, frozen once at import and shared by every verifier
+_STOPWORDS_EN = frozenset({
+    'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'can', 'must', 'shall', 'to', 'of', 'in',
+    'for', 'on', 'with', 'by', 'from', 'as', 'at', 'or', 'and', 'but',
+    'if', 'then', 'than', 'when', 'where', 'why', 'how', 'what', 'which',
+    'who', 'whom', 'whose', 'this', 'that', 'these', 'those', 'i', 'you',
+    'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'
+})
+
+_STOPWORDS_HI = frozenset({
+    'है', 'हैं', 'था', 'थे', 'थी', 'हो', 'होना', 'होने', 'होगा', 'होंगे',
+    'में', 'की', 'के', 'को', 'से', 'पर', 'या', 'और', 'तथा', 'एवं',
+    'यह', 'वह', 'ये', 'वे', 'इस', 'उस', 'इन', 'उन', 'जो', 'जिस',
+    'कि', 'अगर', 'यदि', 'तो', 'फिर', 'भी', 'तक', 'बाद', 'पहले',
+    'अब', 'यहाँ', 'वहाँ', 'कहाँ', 'कब', 'कैसे', 'क्यों', 'क्या',
+    'कौन', 'कौनसा', 'मैं', 'तू', 'आप', 'हम', 'तुम', 'वो'
+})
+
+_STOPWORDS = MappingProxyType({'EN': _STOPWORDS_EN, 'HI': _STOPWORDS_HI})
+
+if hasattr(int, 'bit_count'):
+    # Python 3.10+: native popcount over the integer's machine words
+    _popcount = int.bit_count
+else:
+    def _popcount(bits: int) -> int:
+        """Number of set bits in a non-negative integer"""
+        return bin(bits).count('1')
+
 class GroundingVerifier:
     """
     Verifies that generated text is grounded in source chunks
     Implements token overlap checking as specified in requirements
     """
     
+    # Stopwords for different languages, shared by all verifiers
+    stopwords = _STOPWORDS
+    
     def __init__(self, min_overlap_ratio: float = 0.3, min_tokens: int = 3):
         """
         Initialize grounding verifier
@@ -27,29 +66,8 @@ class GroundingVerifier:
         """
         self.min_overlap_ratio = min_overlap_ratio
         self.min_tokens = min_tokens
-        self.stopwords = self._initialize_stopwords()
-    
-    def _initialize_stopwords(self) -> Dict[str, Set[str]]:
-        """Initialize stopwords for different languages"""
-        return {
-            'EN': {
-                'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-                'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-                'should', 'may', 'might', 'can', 'must', 'shall', 'to', 'of', 'in',
-                'for', 'on', 'with', 'by', 'from', 'as', 'at', 'or', 'and', 'but',
-                'if', 'then', 'than', 'when', 'where', 'why', 'how', 'what', 'which',
-                'who', 'whom', 'whose', 'this', 'that', 'these', 'those', 'i', 'you',
-                'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'
-            },
-            'HI': {
-                'है', 'हैं', 'था', 'थे', 'थी', 'हो', 'होना', 'होने', 'होगा', 'होंगे',
-                'में', 'की', 'के', 'को', 'से', 'पर', 'या', 'और', 'तथा', 'एवं',
-                'यह', 'वह', 'ये', 'वे', 'इस', 'उस', 'इन', 'उन', 'जो', 'जिस',
-                'कि', 'अगर', 'यदि', 'तो', 'फिर', 'भी', 'तक', 'बाद', 'पहले',
-                'अब', 'यहाँ', 'वहाँ', 'कहाँ', 'कब', 'कैसे', 'क्यों', 'क्या',
-                'कौन', 'कौनसा', 'मैं', 'तू', 'आप', 'हम', 'तुम', 'वो'
-            }
-        }
+        # Chunks recur across checks and requests, so their content tokens are memoised by text
+        self._chunk_content_tokens = lru_cache(maxsize=1024)(self._compute_content_tokens)
     
     def verify_grounding(self, generated_text: str, top_chunks: List[Dict]) -> Dict[str, Any]:
         """
@@ -93,14 +111,10 @@ class GroundingVerifier:
             chunk_overlaps = []
             all_overlapping_tokens = set()
             
-            for i, chunk in enumerate(top_chunks):
-                chunk_text = chunk.get('text', '')
-                if not chunk_text:
+            for i, (chunk, chunk_content_tokens) in enumerate(zip(top_chunks, self._prepare_chunks(top_chunks))):
+                if not chunk.get('text', ''):
                     continue
                 
-                chunk_tokens = self._tokenize_text(chunk_text)
-                chunk_content_tokens = self._filter_content_tokens(chunk_tokens)
-                
                 # Find overlapping tokens
                 overlap = content_tokens.intersection(chunk_content_tokens)
                 overlap_ratio = len(overlap) / len(content_tokens) if content_tokens else 0.0
@@ -166,43 +180,51 @@ class GroundingVerifier:
                 'error': str(e)
             }
     
+    def _compute_content_tokens(self, text: str) -> FrozenSet[str]:
+        """Content tokens (stopwords removed) of a text"""
+        return frozenset(self._filter_content_tokens(self._tokenize_text(text)))
+    
+    def _prepare_chunks(self, top_chunks: List[Dict]) -> List[FrozenSet[str]]:
+        """Content tokens for each chunk, tokenised once per distinct chunk text"""
+        empty = frozenset()
+        return [
+            self._chunk_content_tokens(text) if text else empty
+            for text in (chunk.get('text', '') for chunk in top_chunks)
+        ]
+    
     def _tokenize_text(self, text: str) -> Set[str]:
         """Tokenize text into normalized tokens"""
         # Convert to lowercase
         text = text.lower()
         
         # Remove punctuation
-        text = text.translate(str.maketrans('', '', string.punctuation))
+        text = text.translate(_PUNCTUATION_TABLE)
         
         # Handle different scripts
         if self._contains_devanagari(text):
             # Devanagari tokenization
-            tokens = re.findall(r'[\u0900-\u097F]+', text)
+            tokens = DEVANAGARI_TOKEN_RE.findall(text)
         else:
             # Latin script tokenization
-            tokens = re.findall(r'\b[a-zA-Z]+\b', text)
+            tokens = LATIN_TOKEN_RE.findall(text)
         
         # Filter out very short tokens
-        tokens = [token for token in tokens if len(token) > 1]
-        
-        return set(tokens)
+        return {token for token in tokens if len(token) > 1}
     
     def _contains_devanagari(self, text: str) -> bool:
         """Check if text contains Devanagari script"""
-        return bool(re.search(r'[\u0900-\u097F]', text))
+        return DEVANAGARI_RE.search(text) is not None
     
     def _filter_content_tokens(self, tokens: Set[str]) -> Set[str]:
         """Filter out stopwords to get content tokens"""
-        # Determine language based on tokens
-        if any(self._contains_devanagari(token) for token in tokens):
+        # Determine language based on tokens, with one scan over all of them
+        if self._contains_devanagari(' '.join(tokens)):
             stopwords = self.stopwords['HI']
         else:
             stopwords = self.stopwords['EN']
         
         # Filter out stopwords
-        content_tokens = {token for token in tokens if token not in stopwords}
-        
-        return content_tokens
+        return set(tokens).difference(stopwords)
     
     def _calculate_grounding_score(self, overlap_count: int, overlap_ratio: float, chunk_overlaps: List[Dict]) -> float:
         """Calculate grounding score based on overlap metrics"""
@@ -300,28 +322,53 @@ class GroundingVerifier:
         Returns:
             True if sentence has at least one token overlap with chunks
         """
-        try:
-            sentence_tokens = self._tokenize_text(sentence)
-            content_tokens = self._filter_content_tokens(sentence_tokens)
-            
-            if not content_tokens:
-                return False
+        return self.verify_batch([sentence], top_chunks)[0]['grounded']
+    
+    def verify_batch(self, sentences: List[str], top_chunks: List[Dict]) -> List[Dict[str, Any]]:
+        """
+        Check many sentences for token overlap with chunks in one pass
+        
+        Chunk tokens are numbered once and every chunk and sentence becomes an
+        integer bitset, so each sentence/chunk overlap is a single AND plus popcount.
+        
+        Args:
+            sentences: Sentences to check
+            top_chunks: Source chunks
             
-            # Check if any token overlaps with any chunk
-            for chunk in top_chunks:
-                chunk_text = chunk.get('text', '')
-                chunk_tokens = self._tokenize_text(chunk_text)
-                chunk_content_tokens = self._filter_content_tokens(chunk_tokens)
+        Returns:
+            Per sentence, a dict with 'grounded' (at least one overlapping token)
+            and 'chunk_overlaps' (overlapping token count for each chunk)
+        """
+        try:
+            # Bit position for every distinct chunk content token
+            token_bits = {}
+            chunk_bitsets = []
+            for chunk_tokens in self._prepare_chunks(top_chunks):
+                bitset = 0
+                for token in chunk_tokens:
+                    bitset |= 1 << token_bits.setdefault(token, len(token_bits))
+                chunk_bitsets.append(bitset)
+            
+            results = []
+            for sentence in sentences:
+                content_tokens = self._filter_content_tokens(self._tokenize_text(sentence))
+                sentence_bitset = 0
+                for token in content_tokens:
+                    bit = token_bits.get(token)
+                    if bit is not None:
+                        sentence_bitset |= 1 << bit
                 
-                # If there's any overlap, sentence is grounded
-                if content_tokens.intersection(chunk_content_tokens):
-                    return True
+                chunk_overlaps = [_popcount(sentence_bitset & bitset) for bitset in chunk_bitsets]
+                results.append({
+                    'grounded': any(chunk_overlaps),
+                    'chunk_overlaps': chunk_overlaps
+                })
             
-            return False
+            return results
             
         except Exception as e:
             logger.error(f"Sentence grounding check failed: {str(e)}")
-            return False
+            return [{'grounded': False, 'chunk_overlaps': []} for _ in sentences]
     
     def verify_sentence_by_sentence(self, generated_text: str, top_chunks: List[Dict]) -> Dict[str, Any]:
         """
@@ -342,11 +389,12 @@ class GroundingVerifier:
             sentence_results = []
             all_grounded = True
             
-            for i, sentence in enumerate(sentences):
-                if not sentence.strip():
-                    continue
-                
-                is_grounded = self.check_sentence_grounding(sentence, top_chunks)
+            # Check all non-empty sentences against the chunks in one batch
+            indexed_sentences = [(i, sentence) for i, sentence in enumerate(sentences) if sentence.strip()]
+            batch = self.verify_batch([sentence for _, sentence in indexed_sentences], top_chunks)
+            
+            for (i, sentence), sentence_check in zip(indexed_sentences, batch):
+                is_grounded = sentence_check['grounded']
                 
                 sentence_result = {
                     'sentence_id': i,
@@ -415,9 +463,7 @@ class GroundingVerifier:
             
             # Add key terms from source chunks
             source_tokens = set()
-            for chunk in top_chunks[:2]:  # Use top 2 chunks
-                chunk_tokens = self._tokenize_text(chunk.get('text', ''))
-                chunk_content = self._filter_content_tokens(chunk_tokens)
+            for chunk_content in self._prepare_chunks(top_chunks[:2]):  # Use top 2 chunks
                 source_tokens.update(chunk_content)
             
             # Find important source tokens not in generated text
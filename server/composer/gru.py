@@ -6,12 +6,70 @@ Provides neural text enhancement with optional training capabilities
 import logging
 import os
 import json
+import math
 import time
-from typing import Dict, List, Optional, Any
+from array import array
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import pickle
 
 logger = logging.getLogger(__name__)
 
+class TrainingBuffer:
+    """
+    Training samples stored column-wise
+    
+    Inputs, targets and metadata live in parallel lists and timestamps in a
+    float array, so training batches are contiguous slices instead of
+    per-sample dict lookups. Indexing still yields the sample dicts
+    ({'input', 'target', 'metadata', 'timestamp'}) used elsewhere.
+    """
+    
+    def __init__(self):
+        self.inputs: List[str] = []
+        self.targets: List[str] = []
+        self.metadata: List[Dict] = []
+        self.timestamps = array('d')
+    
+    def append(self, input_text: str, target_text: str, metadata: Dict, timestamp: float):
+        """Add one sample"""
+        self.inputs.append(input_text)
+        self.targets.append(target_text)
+        self.metadata.append(metadata)
+        self.timestamps.append(timestamp)
+    
+    def __len__(self) -> int:
+        return len(self.inputs)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return {
+            'input': self.inputs[index],
+            'target': self.targets[index],
+            'metadata': self.metadata[index],
+            'timestamp': self.timestamps[index]
+        }
+    
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(len(self)):
+            yield self[i]
+    
+    def batches(self, batch_size: int) -> Iterator[Tuple[List[str], List[str]]]:
+        """Yield (inputs, targets) slices of up to batch_size samples"""
+        for start in range(0, len(self), batch_size):
+            yield self.inputs[start:start + batch_size], self.targets[start:start + batch_size]
+    
+    def to_list(self) -> List[Dict]:
+        """All samples as a list of dicts, e.g. for JSON export"""
+        return list(self)
+    
+    def clear(self):
+        """Remove all samples"""
+        self.inputs.clear()
+        self.targets.clear()
+        self.metadata.clear()
+        del self.timestamps[:]
+
 class GRUStub:
     """
     GRU model stub for text enhancement
@@ -25,7 +83,7 @@ class GRUStub:
         self.model = None
         self.is_trained = False
         self.enhancement_rules = self._initialize_enhancement_rules()
-        self.training_data = []
+        self.training_data = TrainingBuffer()
         
         # Try to load existing model
         self._load_model()
@@ -281,26 +339,20 @@ class GRUStub:
     
     def add_training_data(self, input_text: str, target_text: str, metadata: Dict = None):
         """Add training data for future model training"""
-        training_sample = {
-            'input': input_text,
-            'target': target_text,
-            'metadata': metadata or {},
-            'timestamp': time.time()
-        }
-        
-        self.training_data.append(training_sample)
+        self.training_data.append(input_text, target_text, metadata or {}, time.time())
         
         # Save training data periodically
         if len(self.training_data) % 10 == 0:
             self._save_training_data()
     
-    def train_model(self, epochs: int = 10, batch_size: int = 32) -> Dict[str, Any]:
+    def train_model(self, epochs: int = 10, batch_size: int = 32, fast_mode: bool = False) -> Dict[str, Any]:
         """
         Train GRU model (placeholder implementation)
         
         Args:
             epochs: Number of training epochs
             batch_size: Training batch size
+            fast_mode: Train on the first batch only and skip validation (smoke runs)
             
         Returns:
             Training metrics and results
@@ -325,13 +377,21 @@ class GRUStub:
         
         logger.info("GRU training simulation started...")
         
+        # A real training loop would step over self.training_data.batches(batch_size);
+        # the simulation only reports how many batches that would be
+        batches_per_epoch = math.ceil(len(self.training_data) / batch_size)
+        if fast_mode:
+            batches_per_epoch = min(batches_per_epoch, 1)
+        
         # Simulate training progress
         training_metrics = {
             'epochs_completed': epochs,
+            'batches_per_epoch': batches_per_epoch,
             'final_loss': 0.234,  # Simulated
-            'validation_accuracy': 0.87,  # Simulated
             'training_time': 45.6  # Simulated seconds
         }
+        if not fast_mode:
+            training_metrics['validation_accuracy'] = 0.87  # Simulated
         
         # Mark as trained
         self.is_trained = True
@@ -394,7 +454,7 @@ class GRUStub:
             os.makedirs(os.path.dirname(training_data_path), exist_ok=True)
             
             with open(training_data_path, 'w', encoding='utf-8') as f:
-                json.dump(self.training_data, f, ensure_ascii=False, indent=2)
+                json.dump(self.training_data.to_list(), f, ensure_ascii=False, indent=2)
                 
             logger.info(f"Training data saved: {len(self.training_data)} samples")
             
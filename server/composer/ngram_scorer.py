@@ -6,12 +6,23 @@ Provides text smoothing and fluency scoring using n-gram models
 import logging
 import re
 import math
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Sequence, Tuple, Set
 from collections import defaultdict, Counter
 from functools import lru_cache
+from ._tokenize import HINDI_WORD_RE, WORD_RE
+from .ngram_scorer_numba import NUMBA_AVAILABLE as _NUMBA_AVAILABLE, build_tables
+
+if _NUMBA_AVAILABLE:
+    import numpy as np
+    from .ngram_scorer_numba import encode_sentences, gather_text_scores, score_sentences
 
 logger = logging.getLogger(__name__)
 
+# Fluency scoring weights for n-grams missing from the model
+UNKNOWN_TRIGRAM_SCORE = 0.3
+UNKNOWN_BIGRAM_SCORE = 0.15
+BIGRAM_WEIGHT = 0.5
+
 class NGramScorer:
     """N-gram based text scorer and smoother for improving fluency"""
     
@@ -21,6 +32,14 @@ class NGramScorer:
             'EN': self._initialize_english_model(),
             'HI': self._initialize_hindi_model()
         }
+        self.build_numba_tables()
+    
+    def build_numba_tables(self):
+        """(Re)build dense scoring tables for the JIT kernel; call after changing language_models"""
+        self._numba_tables = {
+            lang: build_tables(model, UNKNOWN_TRIGRAM_SCORE, UNKNOWN_BIGRAM_SCORE, BIGRAM_WEIGHT)
+            for lang, model in self.language_models.items()
+        }
         
     def _initialize_english_model(self) -> Dict:
         """Initialize English n-gram model with common patterns"""
@@ -199,10 +218,10 @@ class NGramScorer:
         # Remove punctuation and split
         if lang == 'HI':
             # Handle Devanagari script
-            words = re.findall(r'[\u0900-\u097F]+|[A-Za-z]+', sentence.lower())
+            words = HINDI_WORD_RE.findall(sentence.lower())
         else:
             # English tokenization
-            words = re.findall(r'\b\w+\b', sentence.lower())
+            words = WORD_RE.findall(sentence.lower())
         
         return [word for word in words if word.strip()]
     
@@ -303,17 +322,28 @@ class NGramScorer:
             Fluency score between 0.0 and 1.0
         """
         try:
-            model = self.language_models.get(lang, self.language_models['EN'])
-            sentences = self._tokenize_sentences(text, lang)
+            model_lang = lang if lang in self.language_models else 'EN'
+            model = self.language_models[model_lang]
+            sentences = [
+                self._tokenize_words(sentence, lang)
+                for sentence in self._tokenize_sentences(text, lang)
+            ]
             
-            total_score = 0.0
-            total_ngrams = 0
-            
-            for sentence in sentences:
-                words = self._tokenize_words(sentence, lang)
-                sentence_score, ngram_count = self._score_sentence(words, model)
-                total_score += sentence_score
-                total_ngrams += ngram_count
+            tables = self._numba_tables.get(model_lang)
+            if tables is not None and tables['trigrams'] is None:
+                # Too large for dense tables: score via the sorted-key lookup
+                return float(self.calculate_fluency_scores_batch([text], lang)[0])
+            if tables is not None:
+                ids, offsets = encode_sentences(sentences, tables)
+                total_score, total_ngrams = score_sentences(ids, offsets, tables['trigrams'], tables['bigrams'])
+            else:
+                total_score = 0.0
+                total_ngrams = 0
+                
+                for words in sentences:
+                    sentence_score, ngram_count = self._score_sentence(words, model)
+                    total_score += sentence_score
+                    total_ngrams += ngram_count
             
             if total_ngrams == 0:
                 return 0.5  # Neutral score for empty/very short text
@@ -325,6 +355,48 @@ class NGramScorer:
             logger.error(f"Fluency scoring failed: {str(e)}")
             return 0.5  # Neutral score on error
     
+    def calculate_fluency_scores_batch(self, texts: Sequence[str], lang: str):
+        """
+        Calculate fluency scores for many texts at once (e.g. template variants)
+        
+        With the array tables available all texts are scored by a single
+        vectorised gather instead of one kernel call per text.
+        
+        Args:
+            texts: Texts to score
+            lang: Language code
+            
+        Returns:
+            Fluency scores between 0.0 and 1.0 in input order, as a numpy
+            array when the array tables are available, otherwise a list
+        """
+        try:
+            model_lang = lang if lang in self.language_models else 'EN'
+            tables = self._numba_tables.get(model_lang)
+            if tables is None:
+                return [self.calculate_fluency_score(text, lang) for text in texts]
+            
+            sentences = []
+            text_of_sentence = []
+            for i, text in enumerate(texts):
+                for sentence in self._tokenize_sentences(text, lang):
+                    sentences.append(self._tokenize_words(sentence, lang))
+                    text_of_sentence.append(i)
+            
+            ids, offsets = encode_sentences(sentences, tables)
+            total_score, total_ngrams = gather_text_scores(
+                ids, offsets, np.array(text_of_sentence, dtype=np.intp), len(texts), tables
+            )
+            
+            # Neutral score for texts without any sentences
+            with np.errstate(divide='ignore', invalid='ignore'):
+                average_score = np.clip(total_score / total_ngrams, 0.0, 1.0)
+            return np.where(total_ngrams == 0, 0.5, average_score)
+            
+        except Exception as e:
+            logger.error(f"Batch fluency scoring failed: {str(e)}")
+            return [0.5] * len(texts)  # Neutral scores on error
+    
     def _score_sentence(self, words: List[str], model: Dict) -> Tuple[float, int]:
         """Score individual sentence and return score and n-gram count"""
         if len(words) < 2:
@@ -339,16 +411,16 @@ class NGramScorer:
             if trigram in model['trigrams']:
                 score += model['trigrams'][trigram]
             else:
-                score += 0.3  # Default score for unknown trigrams
+                score += UNKNOWN_TRIGRAM_SCORE  # Default score for unknown trigrams
             ngram_count += 1
         
         # Score bigrams
         for i in range(len(words) - 1):
             bigram = (words[i], words[i+1])
             if bigram in model['bigrams']:
-                score += model['bigrams'][bigram] * 0.5  # Lower weight for bigrams
+                score += model['bigrams'][bigram] * BIGRAM_WEIGHT  # Lower weight for bigrams
             else:
-                score += 0.15  # Default score for unknown bigrams
+                score += UNKNOWN_BIGRAM_SCORE  # Default score for unknown bigrams
             ngram_count += 0.5  # Partial count for bigrams
         
         return score, ngram_count
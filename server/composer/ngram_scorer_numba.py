@@ -0,0 +1,226 @@
+"""
+Optional Numba kernels for the Uniguru-LM n-gram scorer
+Scores integer-encoded sentences against array trigram/bigram tables
+
+The scoring kernel is taken from the ahead-of-time compiled extension built
+by composer/_kernels_aot.py when present, and JIT-compiled otherwise. Either
+is loaded on first use, so importing the composer never imports Numba.
+Set COMPOSER_JIT=0 to skip the JIT, e.g. in one-shot processes that would
+pay Numba's import and cache-load time on every run.
+"""
+
+import importlib.util
+import logging
+import os
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    _NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Dense tables grow with the cube of the vocabulary; larger models only get the sorted-key tables
+MAX_DENSE_VOCAB = 256
+
+# Bits per word id in packed n-gram keys; ids must stay below 2**ID_BITS
+ID_BITS = 21
+
+# Trailing key in every sorted-key table so searchsorted never runs off the end
+_SENTINEL_KEY = np.uint64(2**64 - 1) if _NUMPY_AVAILABLE else None
+
+def _sorted_key_table(entries: List[Tuple], default: float) -> Tuple:
+    """Sort (packed key, score) pairs into parallel key/score arrays ending in a sentinel"""
+    entries = sorted(entries) + [(int(_SENTINEL_KEY), default)]
+    keys = np.array([key for key, _ in entries], dtype=np.uint64)
+    scores = np.array([score for _, score in entries], dtype=np.float64)
+    return keys, scores
+
+def build_tables(model: Dict, unknown_trigram: float, unknown_bigram: float,
+                 bigram_weight: float) -> Optional[Dict]:
+    """
+    Build array score tables for one language model
+
+    Every word outside the model vocabulary maps to a shared out-of-vocabulary
+    id, and unknown n-grams hold the default scores, so scoring needs no
+    membership tests. N-grams are packed into uint64 keys and kept as sorted
+    key/score arrays for searchsorted lookups; small vocabularies also get
+    dense tables indexed directly by word ids.
+
+    Args:
+        model: Language model with 'trigrams', 'bigrams' and 'vocabulary'
+        unknown_trigram: Score for trigrams missing from the model
+        unknown_bigram: Score for bigrams missing from the model
+        bigram_weight: Weight applied to known bigram scores
+
+    Returns:
+        Dict with 'vocab', 'oov', 'trigram_keys', 'trigram_scores',
+        'bigram_keys', 'bigram_scores', 'trigrams' and 'bigrams' (the dense
+        tables, None above MAX_DENSE_VOCAB), or None when Numba is unavailable
+        or the vocabulary does not fit in the packed keys
+    """
+    if not NUMBA_AVAILABLE or len(model['vocabulary']) >= 2**ID_BITS - 1:
+        return None
+
+    vocab = {word: i for i, word in enumerate(sorted(model['vocabulary']))}
+    oov = len(vocab)
+
+    trigram_ids = [
+        ((vocab[w1] << 2 * ID_BITS) | (vocab[w2] << ID_BITS) | vocab[w3], score)
+        for (w1, w2, w3), score in model['trigrams'].items()
+    ]
+    bigram_ids = [
+        ((vocab[w1] << ID_BITS) | vocab[w2], score * bigram_weight)
+        for (w1, w2), score in model['bigrams'].items()
+    ]
+    trigram_keys, trigram_scores = _sorted_key_table(trigram_ids, unknown_trigram)
+    bigram_keys, bigram_scores = _sorted_key_table(bigram_ids, unknown_bigram)
+
+    trigrams = bigrams = None
+    if len(vocab) <= MAX_DENSE_VOCAB:
+        size = oov + 1
+        trigrams = np.full((size, size, size), unknown_trigram, dtype=np.float64)
+        bigrams = np.full((size, size), unknown_bigram, dtype=np.float64)
+        for (w1, w2, w3), score in model['trigrams'].items():
+            trigrams[vocab[w1], vocab[w2], vocab[w3]] = score
+        for (w1, w2), score in model['bigrams'].items():
+            bigrams[vocab[w1], vocab[w2]] = score * bigram_weight
+
+    return {
+        'vocab': vocab, 'oov': oov,
+        'trigram_keys': trigram_keys, 'trigram_scores': trigram_scores,
+        'bigram_keys': bigram_keys, 'bigram_scores': bigram_scores,
+        'trigrams': trigrams, 'bigrams': bigrams
+    }
+
+def lookup_scores(keys, table_keys, table_scores, default: float):
+    """Look up packed n-gram keys in a sorted-key table, using default for misses"""
+    idx = np.searchsorted(table_keys, keys)
+    return np.where(table_keys[idx] == keys, table_scores[idx], default)
+
+def encode_sentences(sentences: List[List[str]], tables: Dict) -> Tuple:
+    """Encode tokenized sentences as one int32 id array plus sentence offsets"""
+    vocab_get = tables['vocab'].get
+    oov = tables['oov']
+    ids = [vocab_get(word, oov) for words in sentences for word in words]
+
+    offsets = np.zeros(len(sentences) + 1, dtype=np.int64)
+    np.cumsum([len(words) for words in sentences], out=offsets[1:])
+    return np.array(ids, dtype=np.int32), offsets
+
+def gather_text_scores(ids, offsets, text_of_sentence, n_texts: int, tables: Dict) -> Tuple:
+    """
+    Score many texts with one vectorised gather into the score tables
+
+    Every token position looks up the trigram and bigram starting at it,
+    in the dense tables when present and otherwise by searchsorted over the
+    sorted keys; positions whose n-gram would cross a sentence end are
+    masked out, and the rest are summed per text with bincount.
+
+    Args:
+        ids: int32 token ids of all sentences, concatenated
+        offsets: Sentence start offsets into ids (length sentences + 1)
+        text_of_sentence: Index of the text each sentence belongs to
+        n_texts: Number of texts
+        tables: Score tables from build_tables
+
+    Returns:
+        Tuple of (total_score, total_ngrams) float64 arrays, one entry per text
+    """
+    lengths = np.diff(offsets)
+    sentence_of_token = np.repeat(np.arange(lengths.shape[0]), lengths)
+    sentence_end = offsets[1:][sentence_of_token]
+    positions = np.arange(ids.shape[0])
+
+    padded = np.concatenate((ids, np.zeros(2, dtype=np.int32)))
+    first, second, third = padded[:-2], padded[1:-1], padded[2:]
+    if tables['trigrams'] is not None:
+        trigram_scores = tables['trigrams'][first, second, third]
+        bigram_scores = tables['bigrams'][first, second]
+    else:
+        first, second, third = (part.astype(np.uint64) for part in (first, second, third))
+        bits = np.uint64(ID_BITS)
+        # The sentinel slot at the end of each table holds the unknown-n-gram score
+        trigram_scores = lookup_scores(
+            (first << np.uint64(2 * ID_BITS)) | (second << bits) | third,
+            tables['trigram_keys'], tables['trigram_scores'], tables['trigram_scores'][-1]
+        )
+        bigram_scores = lookup_scores(
+            (first << bits) | second,
+            tables['bigram_keys'], tables['bigram_scores'], tables['bigram_scores'][-1]
+        )
+    token_scores = (
+        np.where(positions + 2 < sentence_end, trigram_scores, 0.0)
+        + np.where(positions + 1 < sentence_end, bigram_scores, 0.0)
+    )
+
+    # Sentences under two words score a flat 0.5 over one n-gram
+    short = lengths < 2
+    sentence_bonus = np.where(short, 0.5, 0.0)
+    sentence_ngrams = np.where(short, 1.0, (lengths - 2) + 0.5 * (lengths - 1))
+
+    total_score = (
+        np.bincount(text_of_sentence[sentence_of_token], weights=token_scores, minlength=n_texts)
+        + np.bincount(text_of_sentence, weights=sentence_bonus, minlength=n_texts)
+    )
+    total_ngrams = np.bincount(text_of_sentence, weights=sentence_ngrams, minlength=n_texts)
+    return total_score, total_ngrams
+
+def _score_sentences(ids, offsets, trigrams, bigrams):
+    """Sum n-gram scores and counts over all sentences, matching NGramScorer._score_sentence"""
+    total_score = 0.0
+    total_ngrams = 0.0
+    for s in range(offsets.shape[0] - 1):
+        start = offsets[s]
+        n = offsets[s + 1] - start
+        if n < 2:
+            total_score += 0.5
+            total_ngrams += 1.0
+            continue
+
+        score = 0.0
+        for i in range(start, start + n - 2):
+            score += trigrams[ids[i], ids[i + 1], ids[i + 2]]
+        for i in range(start, start + n - 1):
+            score += bigrams[ids[i], ids[i + 1]]
+
+        total_score += score
+        total_ngrams += (n - 2) + 0.5 * (n - 1)
+    return total_score, total_ngrams
+
+# Compiled scoring: prebuilt AOT extension first, then the JIT; without
+# either the scorer stays on its pure-Python path. Only located here, not
+# imported, so the cost lands on the first score_sentences call.
+JIT_ENABLED = os.environ.get('COMPOSER_JIT', '1') != '0'
+_AOT_AVAILABLE = _NUMPY_AVAILABLE and importlib.util.find_spec('._ngram_kernels_aot', __package__) is not None
+NUMBA_AVAILABLE = _AOT_AVAILABLE or (
+    _NUMPY_AVAILABLE and JIT_ENABLED and importlib.util.find_spec('numba') is not None
+)
+
+_score_kernel = None
+
+def _load_score_kernel():
+    """The AOT kernel if it loads, else the JIT (compiled or read from its cache)"""
+    if _AOT_AVAILABLE:
+        try:
+            from ._ngram_kernels_aot import score_sentences as kernel
+            return kernel
+        except ImportError as e:
+            logger.warning(f"AOT n-gram kernel failed to load: {e}")
+    if JIT_ENABLED:
+        try:
+            from numba import njit
+            return njit(cache=True)(_score_sentences)
+        except ImportError as e:
+            logger.warning(f"Numba failed to load: {e}")
+    # Same results over the same arrays, just interpreted
+    return _score_sentences
+
+def score_sentences(ids, offsets, trigrams, bigrams):
+    """Run the compiled _score_sentences kernel, loading it on first use"""
+    global _score_kernel
+    if _score_kernel is None:
+        _score_kernel = _load_score_kernel()
+    return _score_kernel(ids, offsets, trigrams, bigrams)
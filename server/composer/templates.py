@@ -3,75 +3,228 @@ Template engine for Uniguru-LM composer
 Handles different composition templates: explain, compare, example
 """
 
+import importlib.util
 import logging
 import re
-from typing import Dict, List, Tuple, Any
+import string
+import sys
+from typing import Dict, Iterable, List, Tuple
 from enum import Enum
+from functools import cached_property, lru_cache
+from ._chunk_keys import chunk_cache_key, chunks_from_key
+from .ngram_scorer_numba import JIT_ENABLED
+
+# Optional JIT-compiled keyword matching; Numba itself is imported on first use
+try:
+    import numpy as np
+    _NUMBA_AVAILABLE = JIT_ENABLED and importlib.util.find_spec('numba') is not None
+except ImportError:
+    _NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Cleanup patterns for composed text, compiled once at import
+_EXCESS_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+_MULTI_SPACE_RE = re.compile(r' +')
+_SENTENCE_BOUNDARY_RE = re.compile(r'([.!?])\s*([A-Z])')
+
+SUPPORTED_LANGS = ("EN", "HI")
+
 class TemplateType(Enum):
     EXPLAIN = "explain"
     COMPARE = "compare"
     EXAMPLE = "example"
     EXTRACTIVE = "extractive"
 
+# Keywords that suggest different template types
+TEMPLATE_KEYWORDS = {
+    TemplateType.EXPLAIN: ("what", "how", "why", "क्या", "कैसे", "क्यों", "explain", "meaning", "definition"),
+    TemplateType.COMPARE: ("different", "compare", "versus", "vs", "अंतर", "तुलना", "difference", "contrast"),
+    TemplateType.EXAMPLE: ("example", "instance", "for example", "such as", "उदाहरण", "जैसे", "like")
+}
+
+# Internal per-language templates are lists indexed by these constants
+TT_EXPLAIN, TT_COMPARE, TT_EXAMPLE, TT_EXTRACTIVE = range(4)
+_TEMPLATE_TYPE_ORDER = (TemplateType.EXPLAIN, TemplateType.COMPARE, TemplateType.EXAMPLE, TemplateType.EXTRACTIVE)
+
+# Types scored by keyword analysis; positions line up with TT_EXPLAIN..TT_EXAMPLE
+SCORED_TEMPLATE_TYPES = _TEMPLATE_TYPE_ORDER[:TT_EXTRACTIVE]
+
+# All keywords in one table, each tagged with its TT_* index
+_KEYWORD_TABLE = tuple(
+    (keyword, i)
+    for i, template_type in enumerate(SCORED_TEMPLATE_TYPES)
+    for keyword in TEMPLATE_KEYWORDS[template_type]
+)
+
+if _NUMBA_AVAILABLE:
+    def _keyword_hits_py(text, kw_bytes, kw_offsets):
+        """Mark which keywords (packed UTF-8 byte strings) occur in text"""
+        n_keywords = kw_offsets.shape[0] - 1
+        hits = np.zeros(n_keywords, dtype=np.uint8)
+        n = text.shape[0]
+        for k in range(n_keywords):
+            start = kw_offsets[k]
+            length = kw_offsets[k + 1] - start
+            for i in range(n - length + 1):
+                j = 0
+                while j < length and text[i + j] == kw_bytes[start + j]:
+                    j += 1
+                if j == length:
+                    hits[k] = 1
+                    break
+        return hits
+    
+    _keyword_hits_kernel = None
+    
+    def _keyword_hits(text, kw_bytes, kw_offsets):
+        """JIT-compiled _keyword_hits_py, compiled (or read from cache) on first use"""
+        global _keyword_hits_kernel
+        if _keyword_hits_kernel is None:
+            try:
+                from numba import njit
+                _keyword_hits_kernel = njit(cache=True)(_keyword_hits_py)
+            except ImportError as e:
+                logger.warning(f"Numba failed to load: {e}")
+                _keyword_hits_kernel = _keyword_hits_py
+        return _keyword_hits_kernel(text, kw_bytes, kw_offsets)
+    
+    # Keywords packed into flat arrays for the JIT kernel. Matching UTF-8
+    # bytes is equivalent to substring matching for Devanagari as well.
+    _encoded_keywords = [(keyword.encode('utf-8'), i) for keyword, i in _KEYWORD_TABLE]
+    _KW_BYTES = np.frombuffer(b''.join(kw for kw, _ in _encoded_keywords), dtype=np.uint8)
+    _KW_OFFSETS = np.cumsum([0] + [len(kw) for kw, _ in _encoded_keywords]).astype(np.int64)
+    _KW_CLASSES = np.array([i for _, i in _encoded_keywords], dtype=np.int64)
+
+def _count_keywords(texts: Iterable[str]) -> List[int]:
+    """Count distinct keywords present in any of the texts for each scored template type"""
+    if _NUMBA_AVAILABLE:
+        hits = np.zeros(len(_KEYWORD_TABLE), dtype=np.uint8)
+        for text in texts:
+            hits |= _keyword_hits(np.frombuffer(text.encode('utf-8'), dtype=np.uint8), _KW_BYTES, _KW_OFFSETS)
+        return np.bincount(_KW_CLASSES, weights=hits, minlength=len(SCORED_TEMPLATE_TYPES)).astype(int).tolist()
+    
+    hits = [False] * len(_KEYWORD_TABLE)
+    for text in texts:
+        for k, (keyword, _) in enumerate(_KEYWORD_TABLE):
+            if not hits[k] and keyword in text:
+                hits[k] = True
+    
+    counts = [0] * len(SCORED_TEMPLATE_TYPES)
+    for hit, (_, i) in zip(hits, _KEYWORD_TABLE):
+        if hit:
+            counts[i] += 1
+    return counts
+
+# Every template field, in the order template variable tuples are laid out
+FIELDS = (
+    'extractive_answer', 'primary_source', 'primary_quote', 'secondary_quotes',
+    'explanation_body', 'comparison_body', 'examples_body',
+    'conclusion_insight', 'synthesis_statement', 'key_principle', 'citations'
+)
+FIELD_IDX = {name: i for i, name in enumerate(FIELDS)}
+
+@lru_cache(maxsize=512)
+def _cite_fragment(index: int, source: str) -> str:
+    """Citation fragment such as "[1] Bhagavad Gita"; sources repeat across requests"""
+    return f"[{index}] {source}"
+
 class TemplateEngine:
     """Manages template selection and application for text composition"""
     
     def __init__(self):
-        self.templates = self._initialize_templates()
-        
-    def _initialize_templates(self) -> Dict[str, Dict]:
-        """Initialize all available templates for different languages and types"""
+        # Templates are built per language on first use and cached
+        self._lang_templates = lru_cache(maxsize=4)(self._build_lang_templates)
+        self._bodies = self._initialize_bodies()
+        self._insights = self._initialize_insights()
+        # Composed outputs keyed by (answer, top-chunk fingerprint, lang)
+        self._compose_cache = lru_cache(maxsize=2048)(self._compose_inner)
+        # Template type choices keyed by (answer, top-chunk texts); language-independent
+        self._template_type_cache = lru_cache(maxsize=4096)(self._template_type_for)
+    
+    @cached_property
+    def templates(self) -> Dict[str, Dict]:
+        """All available templates keyed by language and TemplateType (built on first access)"""
         return {
-            # English Templates
-            "EN": {
-                TemplateType.EXPLAIN: {
-                    "id": "explain_en",
-                    "pattern": self._get_explain_template_en(),
-                    "description": "Explanatory template for detailed answers"
-                },
-                TemplateType.COMPARE: {
-                    "id": "compare_en", 
-                    "pattern": self._get_compare_template_en(),
-                    "description": "Comparative template for contrasting concepts"
-                },
-                TemplateType.EXAMPLE: {
-                    "id": "example_en",
-                    "pattern": self._get_example_template_en(),
-                    "description": "Example-based template with illustrations"
-                },
-                TemplateType.EXTRACTIVE: {
-                    "id": "extractive_en",
-                    "pattern": self._get_extractive_template_en(),
-                    "description": "Extractive template with heavy citations"
-                }
-            },
+            lang: dict(zip(_TEMPLATE_TYPE_ORDER, self._lang_templates(lang)))
+            for lang in SUPPORTED_LANGS
+        }
+    
+    def _templates_for(self, lang: str) -> List[Dict]:
+        """Templates for the given language, defaulting to English"""
+        return self._lang_templates(lang if lang in SUPPORTED_LANGS else "EN")
+        
+    def _build_lang_templates(self, lang: str) -> List[Dict]:
+        """Build the templates of every type for a single language, indexed by TT_* constants"""
+        if lang == "HI":
             # Hindi Templates
-            "HI": {
-                TemplateType.EXPLAIN: {
+            templates = [
+                {
                     "id": "explain_hi",
                     "pattern": self._get_explain_template_hi(),
                     "description": "व्याख्यात्मक टेम्प्लेट विस्तृत उत्तरों के लिए"
                 },
-                TemplateType.COMPARE: {
+                {
                     "id": "compare_hi",
                     "pattern": self._get_compare_template_hi(), 
                     "description": "तुलनात्मक टेम्प्लेट विपरीत अवधारणाओं के लिए"
                 },
-                TemplateType.EXAMPLE: {
+                {
                     "id": "example_hi",
                     "pattern": self._get_example_template_hi(),
                     "description": "उदाहरण-आधारित टेम्प्लेट चित्रण के साथ"
                 },
-                TemplateType.EXTRACTIVE: {
+                {
                     "id": "extractive_hi",
                     "pattern": self._get_extractive_template_hi(),
                     "description": "निष्कर्षण टेम्प्लेट भारी उद्धरण के साथ"
                 }
-            }
-        }
+            ]
+        else:
+            # English Templates
+            templates = [
+                {
+                    "id": "explain_en",
+                    "pattern": self._get_explain_template_en(),
+                    "description": "Explanatory template for detailed answers"
+                },
+                {
+                    "id": "compare_en", 
+                    "pattern": self._get_compare_template_en(),
+                    "description": "Comparative template for contrasting concepts"
+                },
+                {
+                    "id": "example_en",
+                    "pattern": self._get_example_template_en(),
+                    "description": "Example-based template with illustrations"
+                },
+                {
+                    "id": "extractive_en",
+                    "pattern": self._get_extractive_template_en(),
+                    "description": "Extractive template with heavy citations"
+                }
+            ]
+        
+        # Parse each pattern once so rendering doesn't re-run the format parser
+        formatter = string.Formatter()
+        for template in templates:
+            template['tokens'] = [
+                (literal, field) for literal, field, _, _ in formatter.parse(template['pattern'])
+            ]
+            # Same tokens with fields resolved to positions in FIELDS (-1 for none)
+            template['idx_tokens'] = [
+                (literal, FIELD_IDX[field] if field else -1) for literal, field in template['tokens']
+            ]
+        
+        return templates
+    
+    @staticmethod
+    def _render(idx_tokens: List[Tuple[str, int]], template_vars: Tuple[str, ...]) -> str:
+        """Render pre-parsed template tokens with variables laid out as in FIELDS"""
+        return ''.join(
+            literal + (template_vars[i] if i >= 0 else '')
+            for literal, i in idx_tokens
+        )
     
     def _get_explain_template_en(self) -> str:
         """English explanatory template"""
@@ -171,6 +324,61 @@ Citations: {citations}"""
 
 संदर्भ: {citations}"""
 
+    def compose(self, extractive_answer: str, top_chunks: List[Dict], lang: str) -> Tuple[str, str]:
+        """
+        Select and apply a template in a single pass over the chunks
+        
+        Equivalent to select_template followed by apply_template, but the
+        chunks are walked and the answer lowercased only once. Outputs are
+        cached by answer, top-chunk sources and texts, and language.
+        
+        Args:
+            extractive_answer: The initial extractive answer
+            top_chunks: Retrieved chunks for context and citation
+            lang: Language code (EN/HI)
+            
+        Returns:
+            Tuple of (template_id, composed_text)
+        """
+        try:
+            cache_key = (extractive_answer, chunk_cache_key(top_chunks[:3]), lang)
+            hash(cache_key)
+        except TypeError:
+            # Unhashable inputs can't be cached
+            return self._compose_uncached(extractive_answer, top_chunks, lang)
+        return self._compose_cache(*cache_key)
+    
+    def _compose_inner(self, extractive_answer: str, chunk_key: Tuple, lang: str) -> Tuple[str, str]:
+        """Compose from a hashable chunk fingerprint (cached by compose)"""
+        return self._compose_uncached(extractive_answer, chunks_from_key(chunk_key), lang)
+    
+    def clear_cache(self):
+        """Drop cached composed outputs and template choices, e.g. after changing templates"""
+        self._compose_cache.cache_clear()
+        self._template_type_cache.cache_clear()
+    
+    def _compose_uncached(self, extractive_answer: str, top_chunks: List[Dict], lang: str) -> Tuple[str, str]:
+        """Select and apply a template without consulting the output cache"""
+        lang_templates = self._templates_for(lang)
+        template = lang_templates[TT_EXTRACTIVE]
+        
+        try:
+            answer_lower = extractive_answer.lower()
+            chunk_fields, chunk_texts = self._collect_chunk_fields(top_chunks)
+            
+            template_type = self._score_template_types(answer_lower, (txt.lower() for txt in chunk_texts))
+            template = lang_templates[template_type]
+            logger.info(f"Selected template: {template['id']} for content analysis")
+            
+            template_vars = self._build_template_variables(extractive_answer, answer_lower, chunk_fields, lang)
+            composed_text = self._clean_composed_text(self._render(template['idx_tokens'], template_vars))
+            
+            return template['id'], composed_text
+            
+        except Exception as e:
+            logger.error(f"Template composition failed: {str(e)}")
+            return template['id'], f"{extractive_answer}\n\nSources: {self._format_simple_citations(top_chunks)}"
+    
     def select_template(self, extractive_answer: str, top_chunks: List[Dict], lang: str) -> Tuple[str, Dict]:
         """
         Select appropriate template based on content analysis
@@ -188,7 +396,7 @@ Citations: {citations}"""
             template_type = self._analyze_content_for_template(extractive_answer, top_chunks)
             
             # Get template for language
-            lang_templates = self.templates.get(lang, self.templates["EN"])
+            lang_templates = self._templates_for(lang)
             selected_template = lang_templates[template_type]
             
             logger.info(f"Selected template: {selected_template['id']} for content analysis")
@@ -197,44 +405,40 @@ Citations: {citations}"""
         except Exception as e:
             logger.error(f"Template selection failed: {str(e)}, falling back to extractive")
             # Fallback to extractive template
-            fallback_template = self.templates[lang][TemplateType.EXTRACTIVE]
+            fallback_template = self._templates_for(lang)[TT_EXTRACTIVE]
             return fallback_template['id'], fallback_template
     
-    def _analyze_content_for_template(self, extractive_answer: str, top_chunks: List[Dict]) -> TemplateType:
-        """Analyze content to determine the most suitable template type"""
-        
-        # Keywords that suggest different template types
-        explain_keywords = ["what", "how", "why", "क्या", "कैसे", "क्यों", "explain", "meaning", "definition"]
-        compare_keywords = ["different", "compare", "versus", "vs", "अंतर", "तुलना", "difference", "contrast"]
-        example_keywords = ["example", "instance", "for example", "such as", "उदाहरण", "जैसे", "like"]
-        
-        answer_lower = extractive_answer.lower()
-        
-        # Score each template type
-        explain_score = sum(1 for keyword in explain_keywords if keyword in answer_lower)
-        compare_score = sum(1 for keyword in compare_keywords if keyword in answer_lower)
-        example_score = sum(1 for keyword in example_keywords if keyword in answer_lower)
-        
-        # Check chunk content for additional signals
-        chunk_text = " ".join([chunk.get('text', '') for chunk in top_chunks[:3]]).lower()
-        
-        explain_score += sum(1 for keyword in explain_keywords if keyword in chunk_text) * 0.5
-        compare_score += sum(1 for keyword in compare_keywords if keyword in chunk_text) * 0.5
-        example_score += sum(1 for keyword in example_keywords if keyword in chunk_text) * 0.5
+    def _analyze_content_for_template(self, extractive_answer: str, top_chunks: List[Dict]) -> int:
+        """Analyze content to determine the most suitable template type (a TT_* index)"""
+        chunk_texts = tuple(chunk.get('text', '') for chunk in top_chunks[:3])
+        try:
+            hash((extractive_answer, chunk_texts))
+        except TypeError:
+            # Unhashable inputs can't be cached
+            return self._template_type_for(extractive_answer, chunk_texts)
+        return self._template_type_cache(extractive_answer, chunk_texts)
+    
+    def _template_type_for(self, extractive_answer: str, chunk_texts: Tuple[str, ...]) -> int:
+        """Template type for an answer and top-chunk texts (cached by _analyze_content_for_template)"""
+        return self._score_template_types(
+            extractive_answer.lower(), (text.lower() for text in chunk_texts)
+        )
+    
+    def _score_template_types(self, answer_lower: str, chunk_texts: Iterable[str]) -> int:
+        """Score template types from the lowercased answer and chunk texts, returning a TT_* index"""
         
-        # Determine template based on highest score
-        scores = {
-            TemplateType.EXPLAIN: explain_score,
-            TemplateType.COMPARE: compare_score,
-            TemplateType.EXAMPLE: example_score
-        }
+        # Score each template type, with chunk content as a weaker signal
+        answer_counts = _count_keywords((answer_lower,))
+        chunk_counts = _count_keywords(chunk_texts)
+        scores = [a + c * 0.5 for a, c in zip(answer_counts, chunk_counts)]
         
-        max_score = max(scores.values())
+        # Determine template based on highest score (first wins on ties)
+        max_score = max(scores)
         if max_score > 0:
-            return max(scores, key=scores.get)
+            return scores.index(max_score)
         else:
             # Default to explain template if no clear signals
-            return TemplateType.EXPLAIN
+            return TT_EXPLAIN
     
     def apply_template(self, template: Dict, extractive_answer: str, top_chunks: List[Dict], lang: str) -> str:
         """
@@ -250,13 +454,11 @@ Citations: {citations}"""
             Composed text using the template
         """
         try:
-            pattern = template['pattern']
-            
             # Prepare template variables
             template_vars = self._prepare_template_variables(extractive_answer, top_chunks, lang)
             
             # Apply template
-            composed_text = pattern.format(**template_vars)
+            composed_text = self._render(template['idx_tokens'], template_vars)
             
             # Clean up and validate
             composed_text = self._clean_composed_text(composed_text)
@@ -268,130 +470,137 @@ Citations: {citations}"""
             # Fallback to simple format
             return f"{extractive_answer}\n\nSources: {self._format_simple_citations(top_chunks)}"
     
-    def _prepare_template_variables(self, extractive_answer: str, top_chunks: List[Dict], lang: str) -> Dict[str, str]:
+    def _prepare_template_variables(self, extractive_answer: str, top_chunks: List[Dict], lang: str) -> Tuple[str, ...]:
         """Prepare variables for template substitution"""
+        answer_lower = extractive_answer.lower()
+        chunk_fields, _ = self._collect_chunk_fields(top_chunks)
+        return self._build_template_variables(extractive_answer, answer_lower, chunk_fields, lang)
+    
+    def _collect_chunk_fields(self, top_chunks: List[Dict]) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Collect chunk-derived template fields in a single pass over the top chunks
         
-        # Get primary source and quote
-        primary_chunk = top_chunks[0] if top_chunks else {}
-        primary_source = primary_chunk.get('source', 'Sacred Texts')
-        primary_quote = primary_chunk.get('text', '')[:200] + '...' if len(primary_chunk.get('text', '')) > 200 else primary_chunk.get('text', '')
-        
-        # Prepare secondary quotes
+        Returns:
+            Tuple of (fields, raw chunk texts for content analysis)
+        """
+        primary_source = 'Sacred Texts'
+        primary_quote = ''
         secondary_quotes = []
-        for chunk in top_chunks[1:3]:  # Next 2 chunks
-            quote = chunk.get('text', '')[:150] + '...' if len(chunk.get('text', '')) > 150 else chunk.get('text', '')
-            source = chunk.get('source', 'Sacred Text')
-            secondary_quotes.append(f"• {source}: \"{quote}\"")
-        
-        # Generate content bodies based on template type
-        explanation_body = self._generate_explanation_body(extractive_answer, top_chunks, lang)
-        comparison_body = self._generate_comparison_body(extractive_answer, top_chunks, lang)
-        examples_body = self._generate_examples_body(extractive_answer, top_chunks, lang)
+        citations = []
+        chunk_texts = []
         
-        # Prepare insights and conclusions
-        conclusion_insight = self._generate_conclusion_insight(extractive_answer, lang)
-        synthesis_statement = self._generate_synthesis_statement(extractive_answer, lang)
-        key_principle = self._generate_key_principle(extractive_answer, lang)
+        for i, chunk in enumerate(top_chunks[:3]):
+            txt = chunk.get('text', '')
+            
+            if i == 0:
+                # Primary source and quote
+                primary_source = chunk.get('source', 'Sacred Texts')
+                primary_quote = (txt[:200] + '...') if len(txt) > 200 else txt
+            else:
+                # Secondary quotes from the next 2 chunks
+                quote = (txt[:150] + '...') if len(txt) > 150 else txt
+                source = chunk.get('source', 'Sacred Text')
+                secondary_quotes.append(f"• {source}: \"{quote}\"")
+            
+            cite_source = chunk.get('source', f'Source {i + 1}')
+            if isinstance(cite_source, str):
+                cite_source = sys.intern(cite_source)
+            citations.append(_cite_fragment(i + 1, cite_source))
+            chunk_texts.append(txt)
         
-        return {
-            'extractive_answer': extractive_answer,
+        fields = {
             'primary_source': primary_source,
             'primary_quote': primary_quote,
             'secondary_quotes': '\n'.join(secondary_quotes),
-            'explanation_body': explanation_body,
-            'comparison_body': comparison_body,
-            'examples_body': examples_body,
-            'conclusion_insight': conclusion_insight,
-            'synthesis_statement': synthesis_statement,
-            'key_principle': key_principle,
-            'citations': self._format_citations(top_chunks)
+            'citations': ", ".join(citations)
         }
+        return fields, chunk_texts
     
-    def _generate_explanation_body(self, answer: str, chunks: List[Dict], lang: str) -> str:
-        """Generate explanatory content body"""
-        if lang == "HI":
-            return f"इस विषय की गहरी समझ के लिए, हमें यह जानना आवश्यक है कि {answer.lower()}। विभिन्न शास्त्रों में इसका विस्तृत वर्णन मिलता है।"
-        else:
-            return f"To understand this concept thoroughly, we need to recognize that {answer.lower()}. The scriptures provide detailed insights into this matter."
-    
-    def _generate_comparison_body(self, answer: str, chunks: List[Dict], lang: str) -> str:
-        """Generate comparative content body"""
-        if lang == "HI":
-            return f"विभिन्न दृष्टिकोणों को देखते हुए, यह स्पष्ट होता है कि {answer.lower()}। परंपरागत और आधुनिक व्याख्याओं में समानताएं और अंतर दोनों हैं।"
-        else:
-            return f"Looking at different perspectives, it becomes clear that {answer.lower()}. Both traditional and contemporary interpretations offer valuable insights."
-    
-    def _generate_examples_body(self, answer: str, chunks: List[Dict], lang: str) -> str:
-        """Generate example-based content body"""
-        if lang == "HI":
-            return f"उदाहरण के रूप में, हम देख सकते हैं कि {answer.lower()}। यह सिद्धांत दैनिक जीवन में कैसे लागू होता है, इसके कई प्रमाण मिलते हैं।"
-        else:
-            return f"For instance, we can observe that {answer.lower()}. There are numerous examples of how this principle applies in daily life."
-    
-    def _generate_conclusion_insight(self, answer: str, lang: str) -> str:
-        """Generate conclusion insight"""
-        if lang == "HI":
-            return "इस ज्ञान का महत्व और व्यावहारिक अनुप्रयोग"
-        else:
-            return "the significance and practical application of this wisdom"
-    
-    def _generate_synthesis_statement(self, answer: str, lang: str) -> str:
-        """Generate synthesis statement for comparison"""
-        if lang == "HI":
-            return "सभी दृष्टिकोण मिलकर एक संपूर्ण समझ प्रदान करते हैं"
-        else:
-            return "all perspectives together provide a comprehensive understanding"
+    def _build_template_variables(self, extractive_answer: str, answer_lower: str,
+                                  chunk_fields: Dict[str, str], lang: str) -> Tuple[str, ...]:
+        """Combine chunk fields with generated content into template variables ordered as FIELDS"""
+        bodies = self._bodies.get(lang, self._bodies["EN"])
+        insights = self._insights.get(lang, self._insights["EN"])
+        
+        return (
+            str(extractive_answer),
+            str(chunk_fields['primary_source']),
+            chunk_fields['primary_quote'],
+            chunk_fields['secondary_quotes'],
+            bodies['explanation_body'].format(answer=answer_lower),
+            bodies['comparison_body'].format(answer=answer_lower),
+            bodies['examples_body'].format(answer=answer_lower),
+            insights['conclusion_insight'],
+            insights['synthesis_statement'],
+            insights['key_principle'],
+            chunk_fields['citations']
+        )
     
-    def _generate_key_principle(self, answer: str, lang: str) -> str:
-        """Generate key principle for examples"""
-        if lang == "HI":
-            return "मूल सिद्धांत का व्यावहारिक महत्व"
-        else:
-            return "the practical importance of the fundamental principle"
+    def _initialize_bodies(self) -> Dict[str, Dict[str, str]]:
+        """Content body phrases per language, formatted with the lowercased answer"""
+        return {
+            "EN": {
+                'explanation_body': "To understand this concept thoroughly, we need to recognize that {answer}. The scriptures provide detailed insights into this matter.",
+                'comparison_body': "Looking at different perspectives, it becomes clear that {answer}. Both traditional and contemporary interpretations offer valuable insights.",
+                'examples_body': "For instance, we can observe that {answer}. There are numerous examples of how this principle applies in daily life."
+            },
+            "HI": {
+                'explanation_body': "इस विषय की गहरी समझ के लिए, हमें यह जानना आवश्यक है कि {answer}। विभिन्न शास्त्रों में इसका विस्तृत वर्णन मिलता है।",
+                'comparison_body': "विभिन्न दृष्टिकोणों को देखते हुए, यह स्पष्ट होता है कि {answer}। परंपरागत और आधुनिक व्याख्याओं में समानताएं और अंतर दोनों हैं।",
+                'examples_body': "उदाहरण के रूप में, हम देख सकते हैं कि {answer}। यह सिद्धांत दैनिक जीवन में कैसे लागू होता है, इसके कई प्रमाण मिलते हैं।"
+            }
+        }
     
-    def _format_citations(self, chunks: List[Dict]) -> str:
-        """Format citations for templates"""
-        citations = []
-        for i, chunk in enumerate(chunks[:3], 1):
-            source = chunk.get('source', f'Source {i}')
-            citations.append(f"[{i}] {source}")
-        return ", ".join(citations)
+    def _initialize_insights(self) -> Dict[str, Dict[str, str]]:
+        """Fixed conclusion, synthesis and key-principle phrases per language"""
+        return {
+            "EN": {
+                'conclusion_insight': "the significance and practical application of this wisdom",
+                'synthesis_statement': "all perspectives together provide a comprehensive understanding",
+                'key_principle': "the practical importance of the fundamental principle"
+            },
+            "HI": {
+                'conclusion_insight': "इस ज्ञान का महत्व और व्यावहारिक अनुप्रयोग",
+                'synthesis_statement': "सभी दृष्टिकोण मिलकर एक संपूर्ण समझ प्रदान करते हैं",
+                'key_principle': "मूल सिद्धांत का व्यावहारिक महत्व"
+            }
+        }
     
     def _format_simple_citations(self, chunks: List[Dict]) -> str:
         """Simple citation format for fallback"""
         sources = [chunk.get('source', 'Unknown') for chunk in chunks[:3]]
-        return ", ".join(set(sources))  # Remove duplicates
+        return ", ".join(dict.fromkeys(sources))  # Remove duplicates, keep first-seen order
     
     def _clean_composed_text(self, text: str) -> str:
         """Clean and validate composed text"""
         # Remove excessive whitespace
-        text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
+        text = _EXCESS_BLANK_LINES_RE.sub('\n\n', text)
+        text = _MULTI_SPACE_RE.sub(' ', text)
         
         # Ensure proper sentence endings
-        text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)
+        text = _SENTENCE_BOUNDARY_RE.sub(r'\1 \2', text)
         
         return text.strip()
     
     def get_explain_template(self, lang: str) -> Tuple[str, Dict]:
         """Get explain template for given language"""
-        lang_templates = self.templates.get(lang, self.templates["EN"])
-        template = lang_templates[TemplateType.EXPLAIN]
+        lang_templates = self._templates_for(lang)
+        template = lang_templates[TT_EXPLAIN]
         return template['id'], template
     
     def get_compare_template(self, lang: str) -> Tuple[str, Dict]:
         """Get compare template for given language"""
-        lang_templates = self.templates.get(lang, self.templates["EN"])
-        template = lang_templates[TemplateType.COMPARE]
+        lang_templates = self._templates_for(lang)
+        template = lang_templates[TT_COMPARE]
         return template['id'], template
     
     def get_example_template(self, lang: str) -> Tuple[str, Dict]:
         """Get example template for given language"""
-        lang_templates = self.templates.get(lang, self.templates["EN"])
-        template = lang_templates[TemplateType.EXAMPLE]
+        lang_templates = self._templates_for(lang)
+        template = lang_templates[TT_EXAMPLE]
         return template['id'], template
     
     def get_extractive_fallback(self, lang: str) -> Tuple[str, Dict]:
         """Get extractive fallback template for grounding failures"""
-        extractive_template = self.templates[lang][TemplateType.EXTRACTIVE]
+        extractive_template = self._templates_for(lang)[TT_EXTRACTIVE]
         return extractive_template['id'], extractive_template
\ No newline at end of file
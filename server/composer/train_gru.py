@@ -14,13 +14,26 @@ import logging
 import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
 from composer.gru import GRUStub
 
+# Optional faster JSON backends
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -28,6 +41,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# JSON files larger than this are streamed with ijson (when installed)
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Worker threads used to read .txt training files concurrently
+TXT_LOAD_WORKERS = 8
+
+def _load_json_samples(json_path: str) -> list:
+    """Load a JSON array of samples, streaming large files when possible"""
+    if ijson is not None and os.path.getsize(json_path) > STREAM_THRESHOLD_BYTES:
+        with open(json_path, 'rb') as f:
+            return list(ijson.items(f, 'item', use_float=True))
+    
+    if orjson is not None:
+        with open(json_path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _load_jsonl_samples(jsonl_path: str) -> list:
+    """Load newline-delimited JSON samples one line at a time"""
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(jsonl_path, 'rb') as f:
+        return [loads(line) for line in f if line.strip()]
+
+def _parse_txt_file(txt_file: Path) -> list:
+    """Parse one .txt training file, logging and skipping it on failure"""
+    try:
+        source = str(txt_file)
+        with open(txt_file, 'r', encoding='utf-8') as f:
+            # Simple format: alternating lines of input and target
+            lines = (line.strip() for line in f)
+            samples = [
+                {'input': input_text, 'target': target_text, 'source': source}
+                for input_text, target_text in zip(lines, lines)
+                if input_text and target_text
+            ]
+        logger.info(f"Loaded {len(samples)} samples from {txt_file}")
+        return samples
+    except Exception as e:
+        logger.error(f"Failed to load from {txt_file}: {str(e)}")
+        return []
+
 def load_training_data(data_path: str) -> list:
     """Load training data from various sources"""
     training_data = []
@@ -36,81 +92,80 @@ def load_training_data(data_path: str) -> list:
     json_path = os.path.join(data_path, 'training_data.json')
     if os.path.exists(json_path):
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                training_data.extend(data)
-                logger.info(f"Loaded {len(data)} samples from {json_path}")
+            data = _load_json_samples(json_path)
+            training_data.extend(data)
+            logger.info(f"Loaded {len(data)} samples from {json_path}")
         except Exception as e:
             logger.error(f"Failed to load training data from {json_path}: {str(e)}")
     
-    # Try to load from text files
-    txt_files = Path(data_path).glob('*.txt')
-    for txt_file in txt_files:
+    # Try to load from newline-delimited JSON file
+    jsonl_path = os.path.join(data_path, 'training_data.jsonl')
+    if os.path.exists(jsonl_path):
         try:
-            with open(txt_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                # Simple format: alternating lines of input and target
-                for i in range(0, len(lines) - 1, 2):
-                    input_text = lines[i].strip()
-                    target_text = lines[i + 1].strip()
-                    if input_text and target_text:
-                        training_data.append({
-                            'input': input_text,
-                            'target': target_text,
-                            'source': str(txt_file)
-                        })
-            logger.info(f"Loaded {len(lines)//2} samples from {txt_file}")
+            data = _load_jsonl_samples(jsonl_path)
+            training_data.extend(data)
+            logger.info(f"Loaded {len(data)} samples from {jsonl_path}")
         except Exception as e:
-            logger.error(f"Failed to load from {txt_file}: {str(e)}")
+            logger.error(f"Failed to load training data from {jsonl_path}: {str(e)}")
+    
+    # Try to load from text files, reading them concurrently (file order is kept)
+    txt_files = list(Path(data_path).glob('*.txt'))
+    if txt_files:
+        with ThreadPoolExecutor(max_workers=min(TXT_LOAD_WORKERS, len(txt_files))) as executor:
+            for samples in executor.map(_parse_txt_file, txt_files):
+                training_data.extend(samples)
     
     return training_data
 
+# Built-in demonstration samples, shared read-only across calls
+_SYNTHETIC_DATA = (
+    MappingProxyType({
+        'input': "According to the texts, meditation helps achieve peace.",
+        'target': "According to the sacred texts, meditation is a powerful practice that helps us achieve inner peace and spiritual growth. Through regular practice, one can develop deeper understanding.",
+        'metadata': MappingProxyType({'type': 'explanation', 'lang': 'EN'})
+    }),
+    MappingProxyType({
+        'input': "Dharma is important for spiritual growth.",
+        'target': "Dharma, as described in the ancient scriptures, is fundamental for spiritual growth. It represents righteous living and moral conduct that guides us toward liberation.",
+        'metadata': MappingProxyType({'type': 'explanation', 'lang': 'EN'})
+    }),
+    MappingProxyType({
+        'input': "Yoga connects body and mind.",
+        'target': "Yoga, as taught in the sacred traditions, creates a profound connection between body, mind, and spirit. This ancient practice offers a path to self-realization and inner harmony.",
+        'metadata': MappingProxyType({'type': 'explanation', 'lang': 'EN'})
+    }),
+    MappingProxyType({
+        'input': "ध्यान से शांति मिलती है।",
+        'target': "पवित्र ग्रंथों के अनुसार, ध्यान एक ऐसा अभ्यास है जो हमें आंतरिक शांति और आध्यात्मिक विकास प्रदान करता है। नियमित अभ्यास से गहरी समझ विकसित होती है।",
+        'metadata': MappingProxyType({'type': 'explanation', 'lang': 'HI'})
+    }),
+    MappingProxyType({
+        'input': "करुणा सभी धर्मों में महत्वपूर्ण है।",
+        'target': "शास्त्रों के अनुसार, करुणा सभी आध्यात्मिक परंपराओं का केंद्रीय सिद्धांत है। यह दिव्य प्रेम की अभिव्यक्ति है और मोक्ष के पथ पर आवश्यक गुण है।",
+        'metadata': MappingProxyType({'type': 'explanation', 'lang': 'HI'})
+    }),
+    MappingProxyType({
+        'input': "Knowledge and devotion are both important.",
+        'target': "The sacred teachings reveal that both knowledge (jnana) and devotion (bhakti) are essential paths to spiritual realization. While knowledge illuminates the truth, devotion purifies the heart.",
+        'metadata': MappingProxyType({'type': 'comparison', 'lang': 'EN'})
+    }),
+    MappingProxyType({
+        'input': "Service to others is spiritual practice.",
+        'target': "As exemplified in the scriptures, service to others (seva) is a powerful spiritual practice. For instance, when we serve without expectation of reward, we cultivate selflessness and connect with the divine.",
+        'metadata': MappingProxyType({'type': 'example', 'lang': 'EN'})
+    }),
+    MappingProxyType({
+        'input': "Self-control leads to freedom.",
+        'target': "The ancient wisdom teaches that self-control (self-restraint) paradoxically leads to true freedom. By mastering our desires and impulses, we break free from the bondage of conditioning and achieve liberation.",
+        'metadata': MappingProxyType({'type': 'explanation', 'lang': 'EN'})
+    })
+)
+
 def generate_synthetic_data() -> list:
     """Generate synthetic training data for demonstration"""
     logger.info("Generating synthetic training data...")
     
-    synthetic_data = [
-        {
-            'input': "According to the texts, meditation helps achieve peace.",
-            'target': "According to the sacred texts, meditation is a powerful practice that helps us achieve inner peace and spiritual growth. Through regular practice, one can develop deeper understanding.",
-            'metadata': {'type': 'explanation', 'lang': 'EN'}
-        },
-        {
-            'input': "Dharma is important for spiritual growth.",
-            'target': "Dharma, as described in the ancient scriptures, is fundamental for spiritual growth. It represents righteous living and moral conduct that guides us toward liberation.",
-            'metadata': {'type': 'explanation', 'lang': 'EN'}
-        },
-        {
-            'input': "Yoga connects body and mind.",
-            'target': "Yoga, as taught in the sacred traditions, creates a profound connection between body, mind, and spirit. This ancient practice offers a path to self-realization and inner harmony.",
-            'metadata': {'type': 'explanation', 'lang': 'EN'}
-        },
-        {
-            'input': "ध्यान से शांति मिलती है।",
-            'target': "पवित्र ग्रंथों के अनुसार, ध्यान एक ऐसा अभ्यास है जो हमें आंतरिक शांति और आध्यात्मिक विकास प्रदान करता है। नियमित अभ्यास से गहरी समझ विकसित होती है।",
-            'metadata': {'type': 'explanation', 'lang': 'HI'}
-        },
-        {
-            'input': "करुणा सभी धर्मों में महत्वपूर्ण है।",
-            'target': "शास्त्रों के अनुसार, करुणा सभी आध्यात्मिक परंपराओं का केंद्रीय सिद्धांत है। यह दिव्य प्रेम की अभिव्यक्ति है और मोक्ष के पथ पर आवश्यक गुण है।",
-            'metadata': {'type': 'explanation', 'lang': 'HI'}
-        },
-        {
-            'input': "Knowledge and devotion are both important.",
-            'target': "The sacred teachings reveal that both knowledge (jnana) and devotion (bhakti) are essential paths to spiritual realization. While knowledge illuminates the truth, devotion purifies the heart.",
-            'metadata': {'type': 'comparison', 'lang': 'EN'}
-        },
-        {
-            'input': "Service to others is spiritual practice.",
-            'target': "As exemplified in the scriptures, service to others (seva) is a powerful spiritual practice. For instance, when we serve without expectation of reward, we cultivate selflessness and connect with the divine.",
-            'metadata': {'type': 'example', 'lang': 'EN'}
-        },
-        {
-            'input': "Self-control leads to freedom.",
-            'target': "The ancient wisdom teaches that self-control (self-restraint) paradoxically leads to true freedom. By mastering our desires and impulses, we break free from the bondage of conditioning and achieve liberation.",
-            'metadata': {'type': 'explanation', 'lang': 'EN'}
-        }
-    ]
+    synthetic_data = list(_SYNTHETIC_DATA)
     
     logger.info(f"Generated {len(synthetic_data)} synthetic training samples")
     return synthetic_data
@@ -153,7 +208,7 @@ def main():
         gru_model.add_training_data(
             input_text=sample['input'],
             target_text=sample['target'],
-            metadata=sample.get('metadata', {})
+            metadata=dict(sample.get('metadata', {}))
         )
     
     # Train the model
@@ -0,0 +1,40 @@
+"""
+Build hook for the optional ahead-of-time compiled n-gram kernel
+
+Project metadata lives in pyproject.toml. When Numba is importable at build
+time (e.g. `pip install --no-build-isolation .`), the scoring kernel is
+compiled into composer._ngram_kernels_aot during build_py; otherwise it is
+JIT-compiled at runtime. For in-place checkouts and editable installs run
+`python -m composer._kernels_aot` instead.
+"""
+
+import os
+import sys
+
+from setuptools import Distribution, setup
+from setuptools.command.build_py import build_py
+
+# PEP 517 backends don't put the project directory on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    from composer._kernels_aot import cc
+except ImportError:
+    cc = None
+
+class BuildPyWithKernels(build_py):
+    """build_py that also compiles the AOT kernel into the built package"""
+
+    def run(self):
+        super().run()
+        if cc is not None and not getattr(self, 'editable_mode', False):
+            cc.output_dir = os.path.join(self.build_lib, 'composer')
+            cc.compile()
+
+class KernelDistribution(Distribution):
+    """Marks the wheel platform-specific when it carries the compiled kernel"""
+
+    def has_ext_modules(self):
+        return cc is not None
+
+setup(cmdclass={'build_py': BuildPyWithKernels}, distclass=KernelDistribution)
@@ -4,10 +4,31 @@ Quick setup script for Uniguru-LM Composer
 Validates installation and runs basic tests
 """
 
+import contextlib
+import functools
+import importlib.util
+import io
 import os
+import signal
+import site
+import stat
 import sys
 import subprocess
+import threading
 import json
+from collections import defaultdict, deque
+
+UNIT_TEST_FILES = ('tests/test_compose.py',)
+UNIT_TEST_TIMEOUT = 60
+UNIT_TEST_OUTPUT_LINES = 200
+
+# Result marker for checks skipped because a prerequisite failed
+SKIPPED = object()
+
+# Background import of the composer package, started once its files are known to exist
+_warm_import_thread = None
+_warm_import_done = threading.Event()
+_warm_import_error = None
 
 def check_python_version():
     """Check if Python version is compatible"""
@@ -17,6 +38,12 @@ def check_python_version():
     print(f"✅ Python version: {sys.version.split()[0]}")
     return True
 
+@functools.lru_cache(maxsize=None)
+def _have(module):
+    """Whether a module can be imported, resolved once per interpreter"""
+    # Already-loaded modules are a dict lookup; others are located without importing
+    return module in sys.modules or importlib.util.find_spec(module) is not None
+
 def check_dependencies():
     """Check if required modules are available"""
     required_modules = [
@@ -24,12 +51,7 @@ def check_dependencies():
         'collections', 'functools', 'enum', 'os', 'pickle'
     ]
     
-    missing = []
-    for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
-            missing.append(module)
+    missing = [module for module in required_modules if not _have(module)]
     
     if missing:
         print(f"❌ Missing modules: {missing}")
@@ -51,10 +73,25 @@ def check_composer_files():
         'tests/test_compose.py'
     ]
     
-    missing = []
+    # Read each parent directory once instead of stat-ing every file
+    by_dir = defaultdict(list)
     for file_path in required_files:
-        if not os.path.exists(file_path):
-            missing.append(file_path)
+        parent, _, name = file_path.rpartition('/')
+        by_dir[parent].append(name)
+    
+    present = set()
+    for parent, names in by_dir.items():
+        try:
+            with os.scandir(parent or '.') as entries:
+                present.update(f"{parent}/{entry.name}" if parent else entry.name for entry in entries)
+        except OSError:
+            # Directory missing or unreadable: fall back to probing each file
+            present.update(
+                file_path for file_path in (f"{parent}/{name}" for name in names)
+                if os.path.exists(file_path)
+            )
+    
+    missing = [file_path for file_path in required_files if file_path not in present]
     
     if missing:
         print(f"❌ Missing files: {missing}")
@@ -63,22 +100,134 @@ def check_composer_files():
     print("✅ All composer files present")
     return True
 
+def _use_xdist():
+    """
+    Whether to shard the unit test files across cores with pytest-xdist
+    
+    --dist=loadfile hands whole files to workers, so with a single test file
+    every test lands on one worker and xdist would only add start-up time.
+    """
+    return _have('xdist') and len(UNIT_TEST_FILES) > 1
+
+def _pytest_args():
+    """pytest arguments for the unit tests, sharding files across cores when worthwhile"""
+    args = ['-x', '-q', '--durations=25', '--durations-min=0.1', *UNIT_TEST_FILES]
+    if _use_xdist():
+        args[:0] = ['-n', 'auto', '--dist=loadfile']
+    return args
+
+def _unit_test_timeout():
+    """Timeout for the unit test run in seconds"""
+    # Spawning more than 8 xdist workers costs extra startup time
+    if _use_xdist() and (os.cpu_count() or 1) > 8:
+        return UNIT_TEST_TIMEOUT * 2
+    return UNIT_TEST_TIMEOUT
+
+def _run_pytest_in_process(args, timeout):
+    """
+    Run pytest inside this interpreter, enforcing the timeout with SIGALRM
+    
+    Returns:
+        Tuple of (exit code, captured output)
+    """
+    import pytest
+    
+    timed_out = []
+    
+    def on_alarm(signum, frame):
+        timed_out.append(True)
+        # pytest stops the session cleanly on KeyboardInterrupt
+        raise KeyboardInterrupt
+    
+    output = io.StringIO()
+    previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+    signal.alarm(timeout)
+    try:
+        with contextlib.redirect_stdout(output):
+            exit_code = pytest.main(args)
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous_handler)
+    
+    if timed_out:
+        raise subprocess.TimeoutExpired(['pytest'] + args, timeout)
+    return int(exit_code), output.getvalue()
+
+def _child_env():
+    """
+    Environment for child interpreters, trimmed to speed up their startup
+    
+    The user site directory is skipped unless this interpreter actually
+    imports from it (pytest may be installed there with pip --user). The
+    server directory is put on PYTHONPATH so the tests can import composer
+    before it has been installed with pip install -e .
+    """
+    env = dict(os.environ)
+    user_site = site.getusersitepackages() if site.ENABLE_USER_SITE else None
+    if user_site not in sys.path:
+        env['PYTHONNOUSERSITE'] = '1'
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (os.getcwd(), env.get('PYTHONPATH'))))
+    return env
+
+def _run_tests_subprocess(command, timeout):
+    """
+    Run the unit tests in a child interpreter, streaming its output
+    
+    Only the last UNIT_TEST_OUTPUT_LINES lines are kept, which is what gets
+    shown on failure.
+    
+    Returns:
+        Tuple of (exit code, output tail)
+    """
+    tail = deque(maxlen=UNIT_TEST_OUTPUT_LINES)
+    timed_out = threading.Event()
+    
+    with subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        env=_child_env()
+    ) as proc:
+        def on_timeout():
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(timeout, on_timeout)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                tail.append(line)
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(command, timeout)
+    return returncode, ''.join(tail)
+
 def run_unit_tests():
     """Run unit tests"""
     print("\n🧪 Running unit tests...")
     try:
-        result = subprocess.run(
-            [sys.executable, 'tests/test_compose.py'],
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        timeout = _unit_test_timeout()
         
-        if result.returncode == 0:
+        if _have('pytest'):
+            args = _pytest_args()
+            # SIGALRM only exists on POSIX and only works from the main thread
+            if hasattr(signal, 'SIGALRM') and threading.current_thread() is threading.main_thread():
+                returncode, output = _run_pytest_in_process(args, timeout)
+            else:
+                returncode, output = _run_tests_subprocess([sys.executable, '-m', 'pytest'] + args, timeout)
+        else:
+            returncode, output = _run_tests_subprocess([sys.executable, 'tests/test_compose.py'], timeout)
+        
+        if returncode == 0:
             print("✅ All unit tests passed")
             return True
         else:
-            print(f"❌ Unit tests failed:\n{result.stderr}")
+            print(f"❌ Unit tests failed:\n{output}")
             return False
             
     except subprocess.TimeoutExpired:
@@ -88,12 +237,41 @@ def run_unit_tests():
         print(f"❌ Error running tests: {e}")
         return False
 
+def _add_cwd_to_path():
+    """Make the composer package importable; guarded so repeat runs don't grow sys.path"""
+    if '.' not in sys.path:
+        sys.path.insert(0, '.')
+
+def _warm_import_composer():
+    """Import the composer package so later checks find it in sys.modules"""
+    global _warm_import_error
+    try:
+        _add_cwd_to_path()
+        import composer.compose  # noqa: F401
+    except Exception as e:
+        _warm_import_error = e
+    finally:
+        _warm_import_done.set()
+
+def start_composer_warm_import():
+    """Start importing the composer package in a background thread"""
+    global _warm_import_thread
+    if _warm_import_thread is None:
+        _warm_import_thread = threading.Thread(
+            target=_warm_import_composer, name='composer-warm-import', daemon=True
+        )
+        _warm_import_thread.start()
+
 def test_api_functionality():
     """Test basic API functionality"""
     print("\n🔧 Testing API functionality...")
     try:
-        # Import composer
-        sys.path.append('.')
+        # Import composer lazily, reusing the background import if one was started
+        if _warm_import_thread is not None:
+            _warm_import_done.wait()
+            if _warm_import_error is not None:
+                raise _warm_import_error
+        _add_cwd_to_path()
         from composer.compose import compose
         
         # Test data
@@ -138,9 +316,16 @@ def create_directories():
     ]
     
     for directory in directories:
+        # Steady state is that the directory exists, so stat before trying mkdir
+        try:
+            if stat.S_ISDIR(os.stat(directory).st_mode):
+                continue
+        except FileNotFoundError:
+            pass
         os.makedirs(directory, exist_ok=True)
     
     print("✅ Directories created")
+    return True
 
 def main():
     """Main setup function"""
@@ -149,25 +334,40 @@ def main():
     
     # Change to server directory if not already there
     if os.path.basename(os.getcwd()) != 'server':
-        if os.path.exists('server'):
+        # One stat tells us both that 'server' exists and that it is a directory
+        try:
+            server_is_dir = stat.S_ISDIR(os.stat('server').st_mode)
+        except OSError:
+            server_is_dir = False
+        
+        if server_is_dir:
             os.chdir('server')
             print("📁 Changed to server directory")
         else:
             print("❌ Please run from project root or server directory")
             return False
     
+    # Each check lists the checks it depends on; it is skipped if any of them failed
     checks = [
-        ("Python Version", check_python_version),
-        ("Dependencies", check_dependencies),
-        ("Composer Files", check_composer_files),
-        ("Create Directories", create_directories),
-        ("Unit Tests", run_unit_tests),
-        ("API Functionality", test_api_functionality)
+        ("Python Version", check_python_version, []),
+        ("Dependencies", check_dependencies, []),
+        ("Composer Files", check_composer_files, []),
+        ("Create Directories", create_directories, []),
+        ("Unit Tests", run_unit_tests, ["Composer Files"]),
+        ("API Functionality", test_api_functionality, ["Composer Files", "Dependencies"])
     ]
     
     results = []
-    for name, check_func in checks:
+    outcomes = {}
+    for name, check_func, requires in checks:
         print(f"\n📋 {name}...")
+        failed_requirements = [req for req in requires if not outcomes.get(req)]
+        if failed_requirements:
+            print(f"⏭️  SKIP: requires {', '.join(failed_requirements)}")
+            outcomes[name] = False
+            results.append((name, SKIPPED))
+            continue
+        
         try:
             if callable(check_func):
                 success = check_func()
@@ -177,32 +377,43 @@ def main():
             results.append((name, success))
         except Exception as e:
             print(f"❌ {name} failed: {e}")
+            success = False
             results.append((name, False))
+        outcomes[name] = success
+        
+        # Hide the composer import behind the remaining checks
+        if name == "Composer Files" and success:
+            start_composer_warm_import()
     
-    # Summary
-    print("\n" + "=" * 40)
-    print("📊 SETUP SUMMARY")
-    print("=" * 40)
-    
-    passed = sum(1 for _, success in results if success)
+    # Summary, buffered and written in one go
+    passed = sum(1 for _, success in results if success and success is not SKIPPED)
     total = len(results)
     
+    lines = ["\n" + "=" * 40, "📊 SETUP SUMMARY", "=" * 40]
     for name, success in results:
-        status = "✅" if success else "❌"
-        print(f"{status} {name}")
+        if success is SKIPPED:
+            status = "⏭️  SKIP"
+        else:
+            status = "✅" if success else "❌"
+        lines.append(f"{status} {name}")
     
-    print(f"\nResult: {passed}/{total} checks passed")
+    lines.append(f"\nResult: {passed}/{total} checks passed")
     
-    if passed == total:
-        print("\n🎉 Setup completed successfully!")
-        print("\n📚 Next steps:")
-        print("   1. Install Python dependencies: pip install -r composer/requirements.txt")
-        print("   2. Start Node.js server: npm run dev")
-        print("   3. Test endpoints: curl http://localhost:8000/api/composer/test")
-        return True
+    setup_ok = passed == total
+    if setup_ok:
+        lines += [
+            "\n🎉 Setup completed successfully!",
+            "\n📚 Next steps:",
+            "   1. Install Python dependencies: pip install -r composer/requirements.txt",
+            "   2. Install the composer package: pip install -e .",
+            "   3. Start Node.js server: npm run dev",
+            "   4. Test endpoints: curl http://localhost:8000/api/composer/test"
+        ]
     else:
-        print("\n⚠️  Setup incomplete. Please resolve the issues above.")
-        return False
+        lines.append("\n⚠️  Setup incomplete. Please resolve the issues above.")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    return setup_ok
 
 if __name__ == '__main__':
     success = main()
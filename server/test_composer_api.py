@@ -2,129 +2,103 @@
 """
 Test script for Composer API
 Tests the complete composer functionality
+
+Run with pytest (e.g. ``pytest -n auto test_composer_api.py``) or directly.
 """
 
-import json
+import logging
 import sys
-import os
+from types import MappingProxyType
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
 from composer.compose import compose
 
-def test_composer_api():
-    """Test the composer API functionality"""
-    
-    print("Testing Uniguru-LM Composer...")
-    print("=" * 50)
-    
-    # Test data
-    test_cases = [
-        {
-            "name": "English Spiritual Content",
-            "trace_id": "test_en_001",
-            "extractive_answer": "Meditation brings inner peace and spiritual growth through regular practice.",
-            "top_chunks": [
-                {
-                    "text": "According to the Bhagavad Gita, meditation is a powerful practice that leads to inner peace and self-realization.",
-                    "source": "Bhagavad Gita 6.19",
-                    "score": 0.95
-                },
-                {
-                    "text": "The Upanishads teach that regular meditation practice helps achieve spiritual growth and wisdom.",
-                    "source": "Katha Upanishad",
-                    "score": 0.88
-                }
-            ],
-            "lang": "EN"
-        },
-        {
-            "name": "Hindi Spiritual Content", 
-            "trace_id": "test_hi_001",
-            "extractive_answer": "ध्यान से आंतरिक शांति और आध्यात्मिक विकास होता है।",
-            "top_chunks": [
-                {
-                    "text": "भगवद्गीता के अनुसार, ध्यान एक शक्तिशाली अभ्यास है जो आंतरिक शांति लाता है।",
-                    "source": "भगवद्गीता ६.१९",
-                    "score": 0.95
-                },
-                {
-                    "text": "उपनिषदों में कहा गया है कि नियमित ध्यान से आध्यात्मिक विकास होता है।",
-                    "source": "कठोपनिषद",
-                    "score": 0.88
-                }
-            ],
-            "lang": "HI"
-        }
-    ]
-    
-    results = []
-    
-    for test_case in test_cases:
-        print(f"\nTest Case: {test_case['name']}")
-        print("-" * 30)
-        
-        try:
-            # Call composer
-            result = compose(
-                trace_id=test_case['trace_id'],
-                extractive_answer=test_case['extractive_answer'],
-                top_chunks=test_case['top_chunks'],
-                lang=test_case['lang']
-            )
-            
-            # Display results
-            print(f"✓ Trace ID: {result['trace_id']}")
-            print(f"✓ Template ID: {result['template_id']}")
-            print(f"✓ Grounded: {result['grounded']}")
-            print(f"✓ Grounding Score: {result['grounding_score']:.3f}")
-            print(f"✓ Composition Time: {result['composition_time_ms']}ms")
-            print(f"✓ Method: {result['method']}")
-            
-            print(f"\nInput: {test_case['extractive_answer']}")
-            print(f"\nComposed Text:\n{result['final_text']}")
-            
-            if result['citations']:
-                print(f"\nCitations: {len(result['citations'])} sources")
-                for i, citation in enumerate(result['citations'], 1):
-                    print(f"  [{i}] {citation['source']}")
-            
-            results.append({
-                'test_case': test_case['name'],
-                'success': True,
-                'grounded': result['grounded'],
-                'score': result['grounding_score']
+logger = logging.getLogger(__name__)
+
+# Test data, built once at import and shared read-only by every test
+TEST_CASES = (
+    MappingProxyType({
+        "name": "English Spiritual Content",
+        "trace_id": "test_en_001",
+        "extractive_answer": "Meditation brings inner peace and spiritual growth through regular practice.",
+        "top_chunks": (
+            MappingProxyType({
+                "text": "According to the Bhagavad Gita, meditation is a powerful practice that leads to inner peace and self-realization.",
+                "source": "Bhagavad Gita 6.19",
+                "score": 0.95
+            }),
+            MappingProxyType({
+                "text": "The Upanishads teach that regular meditation practice helps achieve spiritual growth and wisdom.",
+                "source": "Katha Upanishad",
+                "score": 0.88
             })
-            
-        except Exception as e:
-            print(f"✗ ERROR: {str(e)}")
-            results.append({
-                'test_case': test_case['name'],
-                'success': False,
-                'error': str(e)
+        ),
+        "lang": "EN"
+    }),
+    MappingProxyType({
+        "name": "Hindi Spiritual Content",
+        "trace_id": "test_hi_001",
+        "extractive_answer": "ध्यान से आंतरिक शांति और आध्यात्मिक विकास होता है।",
+        "top_chunks": (
+            MappingProxyType({
+                "text": "भगवद्गीता के अनुसार, ध्यान एक शक्तिशाली अभ्यास है जो आंतरिक शांति लाता है।",
+                "source": "भगवद्गीता ६.१९",
+                "score": 0.95
+            }),
+            MappingProxyType({
+                "text": "उपनिषदों में कहा गया है कि नियमित ध्यान से आध्यात्मिक विकास होता है।",
+                "source": "कठोपनिषद",
+                "score": 0.88
             })
-    
-    # Summary
-    print("\n" + "=" * 50)
-    print("TEST SUMMARY")
-    print("=" * 50)
-    
-    passed = sum(1 for r in results if r['success'])
-    total = len(results)
-    
-    print(f"Tests Passed: {passed}/{total}")
-    
-    for result in results:
-        status = "✓ PASS" if result['success'] else "✗ FAIL"
-        print(f"{status} - {result['test_case']}")
-        if result['success']:
-            print(f"    Grounded: {result['grounded']}, Score: {result['score']:.3f}")
-        else:
-            print(f"    Error: {result.get('error', 'Unknown error')}")
-    
-    return passed == total
+        ),
+        "lang": "HI"
+    })
+)
+
+# Each case is marked with its language, e.g. `pytest -m en` runs only English cases
+CASE_PARAMS = [
+    pytest.param(tc, id=tc['name'], marks=getattr(pytest.mark, tc['lang'].lower()))
+    for tc in TEST_CASES
+]
+
+@pytest.fixture(scope="session")
+def compose_inputs():
+    """compose() keyword arguments for each test case, keyed by case name"""
+    return {
+        tc['name']: {
+            'trace_id': tc['trace_id'],
+            'extractive_answer': tc['extractive_answer'],
+            'top_chunks': tc['top_chunks'],
+            'lang': tc['lang']
+        }
+        for tc in TEST_CASES
+    }
+
+@pytest.mark.parametrize("test_case", CASE_PARAMS)
+def test_compose_case(test_case, compose_inputs):
+    """Test composing a single case through the composer API"""
+    result = compose(**compose_inputs[test_case['name']])
+
+    # Build the whole per-case report and log it as a single record;
+    # each cited source is listed once, in first-seen order
+    cited_sources = list(dict.fromkeys(c['source'] for c in result['citations']))
+    report = [
+        f"{test_case['name']}: template={result['template_id']}, grounded={result['grounded']}, "
+        f"score={result['grounding_score']:.3f}, time={result['composition_time_ms']}ms, "
+        f"method={result['method']}",
+        f"Composed text:\n{result['final_text']}",
+        f"Citations: {len(cited_sources)} sources"
+    ]
+    report += [f"  [{i}] {source}" for i, source in enumerate(cited_sources, 1)]
+    logger.info("\n".join(report))
+
+    assert result['trace_id'] == test_case['trace_id']
+    assert result['final_text']
+    assert 'template_id' in result
+    assert isinstance(result['grounded'], bool)
+    assert 0.0 <= result['grounding_score'] <= 1.0
+    assert [c['source'] for c in result['citations']] == [c['source'] for c in test_case['top_chunks']]
 
 if __name__ == '__main__':
-    success = test_composer_api()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(pytest.main([__file__, '-v'] + sys.argv[1:]))